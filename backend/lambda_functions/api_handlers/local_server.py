@@ -2,12 +2,23 @@
 Local development server for testing API handlers
 Run with: uvicorn backend.lambda_functions.api_handlers.local_server:app --reload
 """
-from fastapi import FastAPI, HTTPException, status
-from fastapi.middleware.cors import CORSMiddleware
-import uuid
-from datetime import datetime
+from fastapi import FastAPI, File, Form, HTTPException, Query, UploadFile, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from secrets import token_hex
+from typing import Annotated, Optional
 
-from backend.models.request import CatalogSubmissionRequest, CatalogQueryRequest
+from backend.models.request import (
+    CatalogSubmissionRequest,
+    CatalogQueryRequest,
+    MAX_MEDIA_BYTES,
+    TenantId
+)
 from backend.models.response import (
     CatalogSubmissionResponse,
     CatalogStatusResponse,
@@ -15,37 +26,137 @@ from backend.models.response import (
     ErrorResponse,
     HealthCheckResponse
 )
-from backend.models.catalog import ProcessingStatus
+from backend.models.catalog import LanguageCode, ProcessingStatus
 
 app = FastAPI(
     title="Vernacular Artisan Catalog API",
     description="API for submitting and managing artisan product catalogs",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+
+class FastCORS:
+    """
+    Minimal ASGI middleware for the local server's CORS policy
+    
+    Behaves like CORSMiddleware(allow_origins=["*"], allow_methods=["*"],
+    allow_headers=["*"], allow_credentials=True): because credentials are
+    allowed, the request Origin is echoed back instead of "*".
+    """
+    
+    allow_methods = (b"DELETE", b"GET", b"HEAD", b"OPTIONS", b"PATCH", b"POST", b"PUT")
+    preflight_headers = [
+        (b"vary", b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers"),
+        (b"access-control-allow-methods", b", ".join(allow_methods)),
+        (b"access-control-max-age", b"600"),
+        (b"access-control-allow-credentials", b"true"),
+        (b"content-type", b"text/plain; charset=utf-8"),
+    ]
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        
+        # Answer preflight requests without touching the router
+        if origin is not None and scope["method"] == "OPTIONS" and request_method is not None:
+            headers = self.preflight_headers + [(b"access-control-allow-origin", origin)]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            if request_method in self.allow_methods:
+                status_code, body = 200, b"OK"
+            else:
+                status_code, body = 400, b"Disallowed CORS method"
+            await send({
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": headers + [(b"content-length", str(len(body)).encode())]
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+        
+        cors_headers = [(b"vary", b"Origin")]
+        if origin is not None:
+            cors_headers += [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+            ]
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+
 # Enable CORS for local development
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FastCORS)
+
+# Compress larger bodies (e.g. /catalog listings). When running behind API
+# Gateway, leave its payload compression off to avoid compressing twice.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+@dataclass(slots=True)
+class CatalogRow:
+    """Catalog entry held in the in-memory store"""
+    catalog_id: str
+    tenant_id: str
+    language: str
+    status: ProcessingStatus
+    created_at: datetime
+    updated_at: datetime
+    
+    def to_dict(self) -> dict:
+        """Status payload matching CatalogStatusResponse, for direct orjson output"""
+        return {
+            "catalog_id": self.catalog_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "processing_time_ms": None,
+            "error_message": None,
+            "catalog_entry": None
+        }
+
 
 # In-memory storage for local testing
-catalog_store = {}
+catalog_store: dict[str, CatalogRow] = {}
+
+# Secondary indices over catalog_store (insertion-ordered id sets)
+by_tenant = defaultdict(dict)
+by_status = defaultdict(dict)
+
+# Constant part of the /health payload, built once at import
+_HEALTH_PAYLOAD = HealthCheckResponse(
+    status="healthy",
+    services={
+        "api": "operational",
+        "database": "mock",
+        "queue": "mock"
+    }
+).model_dump(mode="json", exclude={"timestamp"})
 
 
 @app.get("/health", response_model=HealthCheckResponse)
 async def health_check():
     """Health check endpoint"""
-    return HealthCheckResponse(
-        status="healthy",
-        services={
-            "api": "operational",
-            "database": "mock",
-            "queue": "mock"
-        }
+    return ORJSONResponse(
+        content={**_HEALTH_PAYLOAD, "timestamp": datetime.now(timezone.utc).isoformat()}
     )
 
 
@@ -60,18 +171,69 @@ async def submit_catalog(request: CatalogSubmissionRequest):
             detail="At least one of image_data or audio_data must be provided"
         )
     
+    return _accept_submission(request.tenant_id, request.language)
+
+
+@app.post(
+    "/catalog/multipart",
+    response_model=CatalogSubmissionResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_catalog_multipart(
+    tenant_id: Annotated[TenantId, Form()],
+    language: LanguageCode = Form(...),
+    image: Optional[UploadFile] = File(None),
+    audio: Optional[UploadFile] = File(None)
+):
+    """
+    Submit a catalog entry with raw media as multipart/form-data
+    
+    Avoids the base64 inflation and JSON escaping of the /catalog body;
+    files are spooled by the form parser rather than held in a str field.
+    """
+    if image is None and audio is None:
+        raise HTTPException(
+            status_code=400,
+            detail="At least one of image or audio must be provided"
+        )
+    
+    for upload in (image, audio):
+        if upload is not None and _upload_size(upload) > MAX_MEDIA_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail="Media data exceeds 10MB limit"
+            )
+    
+    return _accept_submission(tenant_id, language)
+
+
+def _upload_size(upload: UploadFile) -> int:
+    """Size of an uploaded file, measured from the spooled file when the parser gave none"""
+    if upload.size is not None:
+        return upload.size
+    position = upload.file.tell()
+    size = upload.file.seek(0, os.SEEK_END)
+    upload.file.seek(position)
+    return size
+
+
+def _accept_submission(tenant_id: str, language: LanguageCode) -> CatalogSubmissionResponse:
+    """Record a new pending catalog entry in the in-memory store"""
     # Generate catalog ID
-    catalog_id = f"cat_{uuid.uuid4().hex[:12]}"
+    catalog_id = "cat_" + token_hex(6)
     
     # Store in memory (mock)
-    catalog_store[catalog_id] = {
-        "catalog_id": catalog_id,
-        "tenant_id": request.tenant_id,
-        "language": request.language,
-        "status": ProcessingStatus.PENDING,
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
+    now = datetime.now(timezone.utc)
+    catalog_store[catalog_id] = CatalogRow(
+        catalog_id=catalog_id,
+        tenant_id=tenant_id,
+        language=language,
+        status=ProcessingStatus.PENDING,
+        created_at=now,
+        updated_at=now
+    )
+    by_tenant[tenant_id][catalog_id] = None
+    by_status[ProcessingStatus.PENDING.value][catalog_id] = None
     
     return CatalogSubmissionResponse(
         catalog_id=catalog_id,
@@ -81,65 +243,66 @@ async def submit_catalog(request: CatalogSubmissionRequest):
     )
 
 
-
 @app.get("/catalog/{catalog_id}", response_model=CatalogStatusResponse)
 async def get_catalog_status(catalog_id: str):
     """Get status of a specific catalog entry"""
     
-    if catalog_id not in catalog_store:
+    catalog = catalog_store.get(catalog_id)
+    if catalog is None:
         raise HTTPException(
             status_code=404,
             detail=f"Catalog {catalog_id} not found"
         )
     
-    catalog = catalog_store[catalog_id]
-    
-    return CatalogStatusResponse(
-        catalog_id=catalog["catalog_id"],
-        status=catalog["status"],
-        created_at=catalog["created_at"],
-        updated_at=catalog["updated_at"]
-    )
+    # Serialize the stored row directly; it matches CatalogStatusResponse
+    return ORJSONResponse(content=catalog.to_dict())
 
 
-@app.get("/catalog", response_model=CatalogListResponse)
+@app.get(
+    "/catalog",
+    response_model=None,
+    responses={200: {"model": CatalogListResponse}}
+)
 async def list_catalogs(
     tenant_id: str = None,
     status: str = None,
-    limit: int = 10
+    limit: int = Query(10, ge=1)
 ):
     """List catalog entries with optional filters"""
     
-    # Filter catalogs
-    filtered = list(catalog_store.values())
-    
-    if tenant_id:
-        filtered = [c for c in filtered if c.get("tenant_id") == tenant_id]
-    
-    if status:
-        filtered = [c for c in filtered if c.get("status") == status]
-    
-    # Apply limit
-    filtered = filtered[:limit]
-    
-    # Convert to response models
-    catalog_responses = [
-        CatalogStatusResponse(
-            catalog_id=c["catalog_id"],
-            status=c["status"],
-            created_at=c["created_at"],
-            updated_at=c["updated_at"]
+    # Resolve candidate ids from the indices instead of scanning the store
+    if tenant_id and status:
+        smaller, larger = sorted(
+            (by_tenant.get(tenant_id, {}), by_status.get(status, {})),
+            key=len
         )
-        for c in filtered
-    ]
+        ids = (i for i in smaller if i in larger)
+    elif tenant_id:
+        ids = by_tenant.get(tenant_id, {})
+    elif status:
+        ids = by_status.get(status, {})
+    else:
+        ids = catalog_store
     
-    return CatalogListResponse(
-        catalogs=catalog_responses,
-        total=len(catalog_responses),
-        limit=limit
-    )
+    # Apply limit, serializing the stored rows directly in one orjson pass
+    # so no per-item response models are built
+    catalogs = [catalog_store[i].to_dict() for i in islice(ids, limit)]
+    
+    return ORJSONResponse(content={
+        "catalogs": catalogs,
+        "total": len(catalogs),
+        "limit": limit
+    })
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8080,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False
+    )
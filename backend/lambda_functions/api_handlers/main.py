@@ -1,26 +1,37 @@
 """
 API Gateway Lambda handler
 """
-import json
-import uuid
-from datetime import datetime
-from typing import Dict, Any
+import logging
+from secrets import token_hex
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, get_args
+import orjson
+from cachetools import LRUCache, TTLCache
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-# Import models
-import sys
-sys.path.append('/opt/python')  # Lambda layer path
-
-from backend.models.request import CatalogSubmissionRequest, CatalogQueryRequest
+from pydantic import ValidationError
+from backend.models.request import (
+    CatalogSubmissionRequest,
+    CatalogQueryRequest,
+    UploadInitiateRequest,
+    UploadInitiateBatchRequest,
+    UploadCompleteRequest,
+    UploadCompleteBatchRequest,
+    UploadContentType
+)
 from backend.models.response import (
     CatalogSubmissionResponse,
     CatalogListResponse,
     ErrorResponse,
     HealthCheckResponse,
     UploadResponse,
+    UploadBatchResponse,
     UploadCompleteResponse,
+    UploadCompleteBatchResponse,
     StatusUpdate
 )
 from backend.models.catalog import ProcessingStatus
@@ -38,23 +49,131 @@ logger = Logger()
 tracer = Tracer()
 app = APIGatewayRestResolver()
 
+# Upload content types accepted by initiate_upload
+ALLOWED_CONTENT_TYPES_STR = ', '.join(get_args(UploadContentType))
+
+# Serialized status bodies kept across warm invocations. Only 'completed'
+# never changes again; every other stage, including 'failed' (SQS redelivers
+# failed messages and a retry can still complete), is reused for a short window.
+FINAL_STAGES = frozenset({"completed"})
+_final_status_cache = LRUCache(maxsize=100_000)
+_status_cache = TTLCache(maxsize=10_000, ttl=2)
+
+# Constant part of the /health payload, built once per container
+_HEALTH_PAYLOAD = HealthCheckResponse(
+    status="healthy",
+    services={
+        "api": "operational",
+        "database": "operational",
+        "queue": "operational"
+    }
+).model_dump(mode="json", exclude={"timestamp"})
+
+
+def _dump(model) -> str:
+    """Serialize a response model to a JSON string via orjson"""
+    return orjson.dumps(model.model_dump()).decode()
+
+
+def _parse_body(model_cls):
+    """Decode and validate the current request body in a single pass"""
+    return model_cls.model_validate_json(app.current_event.body or "{}")
+
+
+def _error_body(error: str, message: str) -> str:
+    """Serialize a plain error payload to a JSON string"""
+    return orjson.dumps({"error": error, "message": message}).decode()
+
+
+# Pre-serialized bodies for fixed-message error responses
+_ERR_VALIDATION_MISSING_FIELDS = _error_body(
+    "ValidationError", "tenantId, artisanId, and contentType are required"
+)
+_ERR_VALIDATION_CONTENT_TYPE = _error_body(
+    "ValidationError", f"contentType must be one of: {ALLOWED_CONTENT_TYPES_STR}"
+)
+_ERR_VALIDATION_BATCH = _error_body(
+    "ValidationError",
+    "uploads must list 1-25 items, each with tenantId, artisanId, and a contentType "
+    f"of: {ALLOWED_CONTENT_TYPES_STR}"
+)
+_ERR_VALIDATION_TRACKING_ID = _error_body("ValidationError", "trackingId is required")
+_ERR_VALIDATION_BODY = _error_body("ValidationError", "Request body must be a JSON object")
+_ERR_500_INIT = _error_body("InternalServerError", "Failed to initiate upload")
+_ERR_500_INIT_BATCH = _error_body("InternalServerError", "Failed to initiate uploads")
+_ERR_VALIDATION_COMPLETE_BATCH = _error_body(
+    "ValidationError", "uploads must list 1-25 items, each with a trackingId"
+)
+_ERR_500_COMPLETE = _error_body("InternalServerError", "Failed to complete upload")
+_ERR_500_COMPLETE_BATCH = _error_body("InternalServerError", "Failed to complete uploads")
+_ERR_500_STATUS = _error_body("InternalServerError", "Failed to fetch status")
+_ERR_VALIDATION_NO_MEDIA = _dump(ErrorResponse(
+    error="ValidationError",
+    message="At least one of image_data or audio_data must be provided"
+))
+_ERR_500_SUBMIT = _dump(ErrorResponse(
+    error="InternalServerError",
+    message="An unexpected error occurred"
+))
+_ERR_500_GET = _dump(ErrorResponse(
+    error="InternalServerError",
+    message="Failed to fetch catalog status"
+))
+_ERR_500_LIST = _dump(ErrorResponse(
+    error="InternalServerError",
+    message="Failed to list catalogs"
+))
+_ERR_500_BARE = orjson.dumps({"error": "InternalServerError"}).decode()
+
+# Pydantic error types meaning the body was not a JSON object at all
+_BODY_ERROR_TYPES = frozenset({"json_invalid", "model_type"})
+
+# Pre-serialized bodies for requests whose only problem is a missing or
+# empty required field, or (initiate) an unsupported content type
+_INITIATE_FIELD_ERRORS = MappingProxyType({
+    "missing": _ERR_VALIDATION_MISSING_FIELDS,
+    "string_too_short": _ERR_VALIDATION_MISSING_FIELDS,
+    "literal_error": _ERR_VALIDATION_CONTENT_TYPE
+})
+_COMPLETE_FIELD_ERRORS = MappingProxyType({
+    "missing": _ERR_VALIDATION_TRACKING_ID,
+    "string_too_short": _ERR_VALIDATION_TRACKING_ID
+})
+
+
+def _validation_error_body(error: ValidationError, field_errors: Mapping[str, str]) -> str:
+    """
+    Pick the 400 body for a request that failed validation
+    
+    Uses the fixed body for the error type when every error has that type;
+    otherwise lists each invalid field with pydantic's message.
+    """
+    errors = error.errors()
+    types = {err["type"] for err in errors}
+    if types & _BODY_ERROR_TYPES:
+        return _ERR_VALIDATION_BODY
+    if len(types) == 1:
+        body = field_errors.get(next(iter(types)))
+        if body is not None:
+            return body
+    return _error_body("ValidationError", "; ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in errors
+    ))
+
+
+@lru_cache(maxsize=128)
+def _empty_list_body(limit: int) -> str:
+    """Serialized empty catalog list for a given limit (until DynamoDB is wired)"""
+    return _dump(CatalogListResponse(catalogs=[], total=0, limit=limit))
+
 
 @app.get("/health")
-@tracer.capture_method
 def health_check() -> Dict[str, Any]:
-    """Health check endpoint"""
-    logger.info("Health check requested")
-    
-    response = HealthCheckResponse(
-        status="healthy",
-        services={
-            "api": "operational",
-            "database": "operational",
-            "queue": "operational"
-        }
-    )
+    """Health check endpoint (not traced; it is hit by load balancers and monitors)"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Health check requested")
     
-    return response.dict()
+    return {**_HEALTH_PAYLOAD, "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
 # ============================================================================
@@ -78,41 +197,25 @@ def initiate_upload() -> Dict[str, Any]:
     - expiresAt: URL expiration timestamp
     """
     try:
-        request_data = app.current_event.json_body
-        logger.info("Upload initiation requested", extra={"request": request_data})
-        
-        # Validate required fields
-        tenant_id = request_data.get('tenantId')
-        artisan_id = request_data.get('artisanId')
-        content_type = request_data.get('contentType')
-        
-        if not tenant_id or not artisan_id or not content_type:
-            return {
-                "statusCode": 400,
-                "body": json.dumps({
-                    "error": "ValidationError",
-                    "message": "tenantId, artisanId, and contentType are required"
-                })
-            }
-        
-        # Validate content type
-        allowed_types = [
-            'image/jpeg', 'image/png', 
-            'audio/opus', 'audio/mpeg', 'audio/wav'
-        ]
-        if content_type not in allowed_types:
+        # Decode and validate required fields in one pass
+        try:
+            upload_request = _parse_body(UploadInitiateRequest)
+        except ValidationError as e:
             return {
                 "statusCode": 400,
-                "body": json.dumps({
-                    "error": "ValidationError",
-                    "message": f"contentType must be one of: {', '.join(allowed_types)}"
-                })
+                "body": _validation_error_body(e, _INITIATE_FIELD_ERRORS)
             }
+        logger.info("Upload initiation requested", extra={"request": upload_request.model_dump()})
         
         # Initiate upload
-        result = upload_handler.initiate_upload(tenant_id, artisan_id, content_type)
+        result = upload_handler.initiate_upload(
+            upload_request.tenant_id,
+            upload_request.artisan_id,
+            upload_request.content_type
+        )
         
-        response = UploadResponse(
+        # Built from our own handler output, so skip re-validating it
+        response = UploadResponse.model_construct(
             tracking_id=result['tracking_id'],
             upload_url=result['upload_url'],
             expires_at=result['expires_at']
@@ -120,26 +223,72 @@ def initiate_upload() -> Dict[str, Any]:
         
         return {
             "statusCode": 200,
-            "body": response.json()
+            "body": _dump(response)
         }
         
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         return {
             "statusCode": 400,
-            "body": json.dumps({
-                "error": "ValidationError",
-                "message": str(e)
-            })
+            "body": _error_body("ValidationError", str(e))
         }
     except Exception as e:
         logger.error(f"Error initiating upload: {str(e)}", exc_info=True)
         return {
             "statusCode": 500,
-            "body": json.dumps({
-                "error": "InternalServerError",
-                "message": "Failed to initiate upload"
-            })
+            "body": _ERR_500_INIT
+        }
+
+
+@app.post("/v1/catalog/upload/initiate-batch")
+@tracer.capture_method
+def initiate_upload_batch() -> Dict[str, Any]:
+    """
+    Initiate up to 25 uploads in one request
+    
+    Request body:
+    - uploads: List of {tenantId, artisanId, contentType}
+    
+    Returns:
+    - uploads: List of {trackingId, uploadUrl, expiresAt}, in request order
+    """
+    try:
+        try:
+            batch_request = _parse_body(UploadInitiateBatchRequest)
+        except ValidationError:
+            return {
+                "statusCode": 400,
+                "body": _ERR_VALIDATION_BATCH
+            }
+        
+        results = upload_handler.initiate_uploads([
+            {
+                "tenant_id": upload.tenant_id,
+                "artisan_id": upload.artisan_id,
+                "content_type": upload.content_type
+            }
+            for upload in batch_request.uploads
+        ])
+        
+        response = UploadBatchResponse.model_construct(uploads=[
+            UploadResponse.model_construct(
+                tracking_id=result['tracking_id'],
+                upload_url=result['upload_url'],
+                expires_at=result['expires_at']
+            )
+            for result in results
+        ])
+        
+        return {
+            "statusCode": 200,
+            "body": _dump(response)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error initiating upload batch: {str(e)}", exc_info=True)
+        return {
+            "statusCode": 500,
+            "body": _ERR_500_INIT_BATCH
         }
 
 
@@ -161,33 +310,25 @@ def complete_upload() -> Dict[str, Any]:
     - message: Confirmation message
     """
     try:
-        request_data = app.current_event.json_body
-        logger.info("Upload completion requested", extra={"request": request_data})
-        
-        # Validate required fields
-        tracking_id = request_data.get('trackingId')
-        if not tracking_id:
+        # Decode and validate required fields in one pass
+        try:
+            complete_request = _parse_body(UploadCompleteRequest)
+        except ValidationError as e:
             return {
                 "statusCode": 400,
-                "body": json.dumps({
-                    "error": "ValidationError",
-                    "message": "trackingId is required"
-                })
+                "body": _validation_error_body(e, _COMPLETE_FIELD_ERRORS)
             }
-        
-        photo_key = request_data.get('photoKey')
-        audio_key = request_data.get('audioKey')
-        language = request_data.get('language', 'hi')
+        logger.info("Upload completion requested", extra={"request": complete_request.model_dump()})
         
         # Complete upload
         result = upload_handler.complete_upload(
-            tracking_id=tracking_id,
-            photo_key=photo_key,
-            audio_key=audio_key,
-            language=language
+            tracking_id=complete_request.tracking_id,
+            photo_key=complete_request.photo_key,
+            audio_key=complete_request.audio_key,
+            language=complete_request.language
         )
         
-        response = UploadCompleteResponse(
+        response = UploadCompleteResponse.model_construct(
             status=result['status'],
             tracking_id=result['tracking_id'],
             message=result['message']
@@ -195,31 +336,80 @@ def complete_upload() -> Dict[str, Any]:
         
         return {
             "statusCode": 200,
-            "body": response.json()
+            "body": _dump(response)
         }
         
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         return {
             "statusCode": 400,
-            "body": json.dumps({
-                "error": "ValidationError",
-                "message": str(e)
-            })
+            "body": _error_body("ValidationError", str(e))
         }
     except Exception as e:
         logger.error(f"Error completing upload: {str(e)}", exc_info=True)
         return {
             "statusCode": 500,
-            "body": json.dumps({
-                "error": "InternalServerError",
-                "message": "Failed to complete upload"
-            })
+            "body": _ERR_500_COMPLETE
         }
 
 
-@app.get("/v1/catalog/status/<tracking_id>")
+@app.post("/v1/catalog/upload/complete-batch")
 @tracer.capture_method
+def complete_upload_batch() -> Dict[str, Any]:
+    """
+    Complete up to 25 uploads and queue them for processing in one request
+    
+    Request body:
+    - uploads: List of {trackingId, photoKey, audioKey, language}
+    
+    Returns:
+    - uploads: List of {status, trackingId, message}, in request order;
+      status is 'accepted' or 'failed' per upload
+    """
+    try:
+        try:
+            batch_request = _parse_body(UploadCompleteBatchRequest)
+        except ValidationError:
+            return {
+                "statusCode": 400,
+                "body": _ERR_VALIDATION_COMPLETE_BATCH
+            }
+        
+        results = upload_handler.complete_uploads([
+            {
+                "tracking_id": upload.tracking_id,
+                "photo_key": upload.photo_key,
+                "audio_key": upload.audio_key,
+                "language": upload.language
+            }
+            for upload in batch_request.uploads
+        ])
+        
+        response = UploadCompleteBatchResponse.model_construct(uploads=[
+            UploadCompleteResponse.model_construct(
+                status=result['status'],
+                tracking_id=result['tracking_id'],
+                message=result['message']
+            )
+            for result in results
+        ])
+        
+        return {
+            "statusCode": 200,
+            "body": _dump(response)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error completing upload batch: {str(e)}", exc_info=True)
+        return {
+            "statusCode": 500,
+            "body": _ERR_500_COMPLETE_BATCH
+        }
+
+
+# Not wrapped in a tracer subsegment: this is the polling endpoint, and its
+# DynamoDB call is still traced through boto3 patching when it misses the cache
+@app.get("/v1/catalog/status/<tracking_id>")
 def get_catalog_status_v1(tracking_id: str) -> Dict[str, Any]:
     """
     Get processing status for a tracking ID
@@ -237,39 +427,47 @@ def get_catalog_status_v1(tracking_id: str) -> Dict[str, Any]:
     try:
         logger.info("Status requested", extra={"tracking_id": tracking_id})
         
+        # Serve repeated polls from the container-local cache
+        body = _final_status_cache.get(tracking_id) or _status_cache.get(tracking_id)
+        if body is not None:
+            return {
+                "statusCode": 200,
+                "body": body
+            }
+        
         # Get status
         result = upload_handler.get_status(tracking_id)
         
-        response = StatusUpdate(
+        response = StatusUpdate.model_construct(
             tracking_id=result['tracking_id'],
             stage=result['stage'],
             message=result['message'],
             catalog_id=result.get('catalog_id'),
             timestamp=result['timestamp']
         )
+        body = _dump(response)
+        
+        if result['stage'] in FINAL_STAGES:
+            _final_status_cache[tracking_id] = body
+        else:
+            _status_cache[tracking_id] = body
         
         return {
             "statusCode": 200,
-            "body": response.json()
+            "body": body
         }
         
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         return {
             "statusCode": 404,
-            "body": json.dumps({
-                "error": "NotFound",
-                "message": str(e)
-            })
+            "body": _error_body("NotFound", str(e))
         }
     except Exception as e:
         logger.error(f"Error fetching status: {str(e)}", exc_info=True)
         return {
             "statusCode": 500,
-            "body": json.dumps({
-                "error": "InternalServerError",
-                "message": "Failed to fetch status"
-            })
+            "body": _ERR_500_STATUS
         }
 
 
@@ -291,26 +489,19 @@ def submit_catalog() -> Dict[str, Any]:
     - metadata: Additional metadata (optional)
     """
     try:
-        # Parse request
-        request_data = app.current_event.json_body
-        logger.info("Catalog submission received", extra={"tenant_id": request_data.get("tenant_id")})
-        
-        # Validate request
-        submission = CatalogSubmissionRequest(**request_data)
-
+        # Parse and validate request in one pass
+        submission = _parse_body(CatalogSubmissionRequest)
+        logger.info("Catalog submission received", extra={"tenant_id": submission.tenant_id})
         
         # Validate at least one media type is provided
         if not submission.image_data and not submission.audio_data:
             return {
                 "statusCode": 400,
-                "body": ErrorResponse(
-                    error="ValidationError",
-                    message="At least one of image_data or audio_data must be provided"
-                ).json()
+                "body": _ERR_VALIDATION_NO_MEDIA
             }
         
         # Generate catalog ID
-        catalog_id = f"cat_{uuid.uuid4().hex[:12]}"
+        catalog_id = "cat_" + token_hex(6)
         
         # TODO: Store in DynamoDB
         # TODO: Upload media to S3
@@ -328,26 +519,23 @@ def submit_catalog() -> Dict[str, Any]:
         
         return {
             "statusCode": 202,
-            "body": response.json()
+            "body": _dump(response)
         }
         
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         return {
             "statusCode": 400,
-            "body": ErrorResponse(
+            "body": _dump(ErrorResponse(
                 error="ValidationError",
                 message=str(e)
-            ).json()
+            ))
         }
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}", exc_info=True)
         return {
             "statusCode": 500,
-            "body": ErrorResponse(
-                error="InternalServerError",
-                message="An unexpected error occurred"
-            ).json()
+            "body": _ERR_500_SUBMIT
         }
 
 
@@ -365,25 +553,23 @@ def get_catalog_status(catalog_id: str) -> Dict[str, Any]:
         
         # TODO: Fetch from DynamoDB
         
-        # Mock response
+        # Mock response; orjson writes the aware datetime as ISO 8601
+        now = datetime.now(timezone.utc)
         return {
             "statusCode": 200,
-            "body": json.dumps({
+            "body": orjson.dumps({
                 "catalog_id": catalog_id,
                 "status": "processing",
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
-            })
+                "created_at": now,
+                "updated_at": now
+            }).decode()
         }
         
     except Exception as e:
         logger.error(f"Error fetching catalog: {str(e)}", exc_info=True)
         return {
             "statusCode": 500,
-            "body": ErrorResponse(
-                error="InternalServerError",
-                message="Failed to fetch catalog status"
-            ).json()
+            "body": _ERR_500_GET
         }
 
 
@@ -409,25 +595,16 @@ def list_catalogs() -> Dict[str, Any]:
         # TODO: Query DynamoDB
         
         # Mock response
-        response = CatalogListResponse(
-            catalogs=[],
-            total=0,
-            limit=query.limit
-        )
-        
         return {
             "statusCode": 200,
-            "body": response.json()
+            "body": _empty_list_body(query.limit)
         }
         
     except Exception as e:
         logger.error(f"Error listing catalogs: {str(e)}", exc_info=True)
         return {
             "statusCode": 500,
-            "body": ErrorResponse(
-                error="InternalServerError",
-                message="Failed to list catalogs"
-            ).json()
+            "body": _ERR_500_LIST
         }
 
 
@@ -451,7 +628,7 @@ def create_tenant() -> Dict[str, Any]:
         return tenant_handler.create_tenant_configuration(request_data)
     except Exception as e:
         logger.error(f"Error creating tenant: {str(e)}", exc_info=True)
-        return {"statusCode": 500, "body": json.dumps({"error": "InternalServerError"})}
+        return {"statusCode": 500, "body": _ERR_500_BARE}
 
 
 @app.put("/v1/tenant/<tenant_id>")
@@ -463,7 +640,7 @@ def update_tenant(tenant_id: str) -> Dict[str, Any]:
         return tenant_handler.update_tenant_configuration(tenant_id, request_data)
     except Exception as e:
         logger.error(f"Error updating tenant: {str(e)}", exc_info=True)
-        return {"statusCode": 500, "body": json.dumps({"error": "InternalServerError"})}
+        return {"statusCode": 500, "body": _ERR_500_BARE}
 
 
 @app.get("/v1/tenant/<tenant_id>/quota")
@@ -484,7 +661,7 @@ def get_tenant_catalogs(tenant_id: str) -> Dict[str, Any]:
         return tenant_handler.get_tenant_catalogs(tenant_id, limit, next_token)
     except Exception as e:
         logger.error(f"Error fetching tenant catalogs: {str(e)}", exc_info=True)
-        return {"statusCode": 500, "body": json.dumps({"error": "InternalServerError"})}
+        return {"statusCode": 500, "body": _ERR_500_BARE}
 
 
 # ============================================================================
@@ -509,7 +686,7 @@ def get_tenant_metrics(tenant_id: str) -> Dict[str, Any]:
         return analytics_handler.get_tenant_metrics(tenant_id, start_date, end_date)
     except Exception as e:
         logger.error(f"Error fetching metrics: {str(e)}", exc_info=True)
-        return {"statusCode": 500, "body": json.dumps({"error": "InternalServerError"})}
+        return {"statusCode": 500, "body": _ERR_500_BARE}
 
 
 @app.get("/v1/tenant/<tenant_id>/metrics/daily")
@@ -522,7 +699,7 @@ def get_daily_metrics(tenant_id: str) -> Dict[str, Any]:
         return analytics_handler.get_daily_metrics(tenant_id, days)
     except Exception as e:
         logger.error(f"Error fetching daily metrics: {str(e)}", exc_info=True)
-        return {"statusCode": 500, "body": json.dumps({"error": "InternalServerError"})}
+        return {"statusCode": 500, "body": _ERR_500_BARE}
 
 
 @app.get("/v1/tenant/<tenant_id>/distribution/language")
@@ -549,7 +726,7 @@ def get_error_analysis(tenant_id: str) -> Dict[str, Any]:
         return analytics_handler.get_error_analysis(tenant_id, days)
     except Exception as e:
         logger.error(f"Error fetching error analysis: {str(e)}", exc_info=True)
-        return {"statusCode": 500, "body": json.dumps({"error": "InternalServerError"})}
+        return {"statusCode": 500, "body": _ERR_500_BARE}
 
 
 @logger.inject_lambda_context
@@ -575,10 +752,10 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     # Apply data minimization to body if present
     if 'body' in event and event['body']:
         try:
-            body = json.loads(event['body'])
+            body = orjson.loads(event['body'])
             sanitized_body = sanitize_request_body(body)
-            event['body'] = json.dumps(sanitized_body)
-        except json.JSONDecodeError:
+            event['body'] = orjson.dumps(sanitized_body).decode()
+        except orjson.JSONDecodeError:
             # If body is not JSON, leave it as is
             pass
     
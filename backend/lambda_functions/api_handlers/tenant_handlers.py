@@ -40,7 +40,7 @@ class TenantHandler:
                 }
             
             # Remove sensitive fields
-            config_dict = json.loads(tenant_config.json())
+            config_dict = tenant_config.model_dump(mode='json')
             config_dict.pop('ondc_api_key', None)
             
             return {
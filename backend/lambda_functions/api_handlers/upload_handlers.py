@@ -1,37 +1,91 @@
 """
 Upload handlers for resumable multipart uploads
-Implements POST /v1/catalog/upload/initiate, POST /v1/catalog/upload/complete, GET /v1/catalog/status/{trackingId}
+Implements POST /v1/catalog/upload/initiate, POST /v1/catalog/upload/complete,
+POST /v1/catalog/upload/complete-batch, GET /v1/catalog/status/{trackingId}
 """
-import json
-import uuid
+from secrets import token_hex
 import hashlib
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-import boto3
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 from botocore.exceptions import ClientError
 from aws_lambda_powertools import Logger, Tracer
 
 # Import models
-import sys
-sys.path.append('/opt/python')  # Lambda layer path
-
 from backend.models.response import UploadResponse, UploadCompleteResponse, StatusUpdate, ErrorResponse
 from backend.models.catalog import CatalogProcessingRecord, ProcessingStatus
 from backend.lambda_functions.shared.config import config
-from backend.services.s3_upload import multipart_upload_manager
+from backend.lambda_functions.shared.aws import get_client, get_resource
+from backend.services.s3_upload import multipart_upload_manager, S3Presigner
 from backend.services.queue import sqs_publisher
 from backend.services.tenant_service import tenant_service
 
 # Initialize AWS clients
 logger = Logger()
 tracer = Tracer()
-s3_client = boto3.client('s3', region_name=config.AWS_REGION)
-dynamodb = boto3.resource('dynamodb', region_name=config.AWS_REGION)
-sqs_client = boto3.client('sqs', region_name=config.AWS_REGION)
+s3_client = get_client('s3')
+dynamodb = get_resource('dynamodb')
+sqs_client = get_client('sqs')
 
 # DynamoDB tables
 catalog_table = dynamodb.Table(config.DYNAMODB_CATALOG_TABLE)
 
+# Presigner reuses the client's request signer across warm invocations
+raw_media_presigner = S3Presigner(s3_client, config.S3_RAW_MEDIA_BUCKET)
+
+# Constant lookup tables
+EXTENSION_MAP = MappingProxyType({
+    'image/jpeg': 'jpg',
+    'image/png': 'png',
+    'audio/opus': 'opus',
+    'audio/mpeg': 'mp3',
+    'audio/wav': 'wav'
+})
+
+# Record attribute that holds the object key for each content type
+MEDIA_KEY_FIELD = MappingProxyType({
+    'image/jpeg': 'photo_key',
+    'image/png': 'photo_key',
+    'audio/opus': 'audio_key',
+    'audio/mpeg': 'audio_key',
+    'audio/wav': 'audio_key'
+})
+
+STATUS_MESSAGES = MappingProxyType({
+    'uploaded': 'Media uploaded successfully, queued for processing',
+    'processing': 'Processing media with AI models',
+    'extraction': 'Extracting product attributes',
+    'mapping': 'Mapping to ONDC catalog format',
+    'completed': 'Catalog entry successfully published to ONDC',
+    'failed': 'Processing failed'
+})
+
+# Stage statuses that count as the pipeline having reached that stage
+ACTIVE_STATES = frozenset({'in_progress', 'completed'})
+
+# Non-terminal stages indexed by the bit length of _determine_stage's mask
+PIPELINE_STAGES = ('uploaded', 'processing', 'extraction', 'mapping')
+
+# complete_upload UpdateExpression keyed by (has photo_key, has audio_key)
+_COMPLETE_UPDATE_BASE = "SET updated_at = :updated_at, #lang = :language"
+COMPLETE_UPDATE_EXPRESSIONS = MappingProxyType({
+    (False, False): _COMPLETE_UPDATE_BASE,
+    (True, False): _COMPLETE_UPDATE_BASE + ", photo_key = :photo_key",
+    (False, True): _COMPLETE_UPDATE_BASE + ", audio_key = :audio_key",
+    (True, True): _COMPLETE_UPDATE_BASE + ", photo_key = :photo_key, audio_key = :audio_key"
+})
+# 'language' is a DynamoDB reserved word. Plain dict: botocore rejects other mappings.
+COMPLETE_EXPRESSION_NAMES = {'#lang': 'language'}
+
+# Record status fields read by _determine_stage, latest stage first
+STAGE_STATUS_KEYS = (
+    'submission_status',
+    'mapping_status',
+    'extraction_status',
+    'vision_status',
+    'asr_status'
+)
+
 
 class UploadHandler:
     """Handler for resumable upload operations"""
@@ -41,6 +95,7 @@ class UploadHandler:
         self.dynamodb = dynamodb
         self.sqs_client = sqs_client
         self.raw_bucket = config.S3_RAW_MEDIA_BUCKET
+        self.presigner = raw_media_presigner
         self.queue_url = config.SQS_QUEUE_URL
     
     def _apply_tenant_configuration(self, tenant_id: str, record_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -69,6 +124,15 @@ class UploadHandler:
             logger.warning(f"Could not apply tenant configuration: {str(e)}")
             return record_data
     
+    @staticmethod
+    def _media_keys(content_type: str, s3_key: str) -> Dict[str, str]:
+        """Record photo_key/audio_key values for an upload of the given type"""
+        media_keys = {'photo_key': '', 'audio_key': ''}
+        field = MEDIA_KEY_FIELD.get(content_type)
+        if field:
+            media_keys[field] = s3_key
+        return media_keys
+    
     @tracer.capture_method
     def initiate_upload(self, tenant_id: str, artisan_id: str, content_type: str) -> Dict[str, Any]:
         """
@@ -83,68 +147,27 @@ class UploadHandler:
             Dict with tracking_id, upload_url, and expires_at
         """
         try:
-            # Generate tracking ID
-            tracking_id = f"trk_{uuid.uuid4().hex[:16]}"
-            
-            # Determine file extension from content type
-            extension_map = {
-                'image/jpeg': 'jpg',
-                'image/png': 'png',
-                'audio/opus': 'opus',
-                'audio/mpeg': 'mp3',
-                'audio/wav': 'wav'
-            }
-            extension = extension_map.get(content_type, 'bin')
-            
-            # Generate S3 key with tenant isolation
-            s3_key = f"{tenant_id}/{artisan_id}/{tracking_id}.{extension}"
-            
-            # Generate presigned URL for multipart upload (valid for 1 hour)
-            expires_in = 3600  # 1 hour
-            presigned_url = self.s3_client.generate_presigned_url(
-                'put_object',
-                Params={
-                    'Bucket': self.raw_bucket,
-                    'Key': s3_key,
-                    'ContentType': content_type
-                },
-                ExpiresIn=expires_in
+            record, result = self._prepare_upload(
+                tenant_id, artisan_id, content_type, datetime.utcnow()
             )
             
-            # Create initial processing record in DynamoDB
-            now = datetime.utcnow()
-            expires_at = now + timedelta(seconds=expires_in)
-            
-            record = CatalogProcessingRecord(
-                tracking_id=tracking_id,
-                tenant_id=tenant_id,
-                artisan_id=artisan_id,
-                photo_key=s3_key if 'image' in content_type else '',
-                audio_key=s3_key if 'audio' in content_type else '',
-                language='hi',  # Default, will be updated on completion
-                created_at=now,
-                updated_at=now
+            # Store in DynamoDB, never overwriting an existing tracking record
+            catalog_table.put_item(
+                Item=record.to_ddb_item(),
+                ConditionExpression='attribute_not_exists(tracking_id)'
             )
             
-            # Store in DynamoDB
-            catalog_table.put_item(Item=json.loads(record.json()))
-            
             logger.info(
                 "Upload initiated",
                 extra={
-                    "tracking_id": tracking_id,
+                    "tracking_id": record.tracking_id,
                     "tenant_id": tenant_id,
                     "artisan_id": artisan_id,
-                    "s3_key": s3_key
+                    "s3_key": result['s3_key']
                 }
             )
             
-            return {
-                "tracking_id": tracking_id,
-                "upload_url": presigned_url,
-                "expires_at": expires_at.isoformat(),
-                "s3_key": s3_key  # Internal use
-            }
+            return result
             
         except ClientError as e:
             logger.error(f"AWS error initiating upload: {str(e)}", exc_info=True)
@@ -153,6 +176,99 @@ class UploadHandler:
             logger.error(f"Error initiating upload: {str(e)}", exc_info=True)
             raise
     
+    @tracer.capture_method
+    def initiate_uploads(self, uploads: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Initiate several single-part uploads with one batched DynamoDB write
+        
+        Unlike initiate_upload, the records are written WITHOUT the
+        attribute_not_exists(tracking_id) guard: BatchWriteItem does not
+        accept condition expressions. A duplicate would need two freshly
+        generated 64-bit random tracking IDs to collide, which is accepted
+        here in exchange for one round trip per 25 records.
+        
+        Args:
+            uploads: Dicts with tenant_id, artisan_id and content_type
+            
+        Returns:
+            List of initiate_upload results, in input order
+        """
+        try:
+            now = datetime.utcnow()
+            prepared = [
+                self._prepare_upload(u['tenant_id'], u['artisan_id'], u['content_type'], now)
+                for u in uploads
+            ]
+            
+            # batch_writer groups puts into BatchWriteItem calls of 25 and
+            # resubmits any UnprocessedItems returned under throttling.
+            # Unconditional: an existing item with the same tracking_id
+            # would be overwritten (see docstring).
+            with catalog_table.batch_writer() as batch:
+                for record, _ in prepared:
+                    batch.put_item(Item=record.to_ddb_item())
+            
+            logger.info(
+                "Upload batch initiated",
+                extra={
+                    "count": len(prepared),
+                    "tracking_ids": [record.tracking_id for record, _ in prepared]
+                }
+            )
+            
+            return [result for _, result in prepared]
+            
+        except ClientError as e:
+            logger.error(f"AWS error initiating upload batch: {str(e)}", exc_info=True)
+            raise
+        except Exception as e:
+            logger.error(f"Error initiating upload batch: {str(e)}", exc_info=True)
+            raise
+    
+    def _prepare_upload(
+        self,
+        tenant_id: str,
+        artisan_id: str,
+        content_type: str,
+        now: datetime
+    ) -> Tuple[CatalogProcessingRecord, Dict[str, Any]]:
+        """
+        Build the initial processing record and presigned upload URL
+        
+        Returns:
+            Tuple of (record to store, initiate_upload result)
+        """
+        # Generate tracking ID
+        tracking_id = f"trk_{token_hex(8)}"
+        
+        # Determine file extension from content type
+        extension = EXTENSION_MAP.get(content_type, 'bin')
+        
+        # Generate S3 key with tenant isolation
+        s3_key = f"{tenant_id}/{artisan_id}/{tracking_id}.{extension}"
+        
+        # Generate presigned URL for upload (valid for 1 hour)
+        expires_in = 3600  # 1 hour
+        presigned_url = self.presigner.put_object_url(s3_key, content_type, expires_in)
+        expires_at = now + timedelta(seconds=expires_in)
+        
+        record = CatalogProcessingRecord(
+            tracking_id=tracking_id,
+            tenant_id=tenant_id,
+            artisan_id=artisan_id,
+            **self._media_keys(content_type, s3_key),
+            language='hi',  # Default, will be updated on completion
+            created_at=now,
+            updated_at=now
+        )
+        
+        return record, {
+            "tracking_id": tracking_id,
+            "upload_url": presigned_url,
+            "expires_at": expires_at,
+            "s3_key": s3_key  # Internal use
+        }
+    
     @tracer.capture_method
     def initiate_multipart_upload(
         self, 
@@ -175,7 +291,7 @@ class UploadHandler:
         """
         try:
             # Generate tracking ID
-            tracking_id = f"trk_{uuid.uuid4().hex[:16]}"
+            tracking_id = f"trk_{token_hex(8)}"
             
             # Initiate multipart upload using the manager
             result = multipart_upload_manager.initiate_multipart_upload(
@@ -193,15 +309,17 @@ class UploadHandler:
                 tracking_id=tracking_id,
                 tenant_id=tenant_id,
                 artisan_id=artisan_id,
-                photo_key=result['s3_key'] if 'image' in content_type else '',
-                audio_key=result['s3_key'] if 'audio' in content_type else '',
+                **self._media_keys(content_type, result['s3_key']),
                 language='hi',  # Default, will be updated on completion
                 created_at=now,
                 updated_at=now
             )
             
-            # Store in DynamoDB
-            catalog_table.put_item(Item=json.loads(record.json()))
+            # Store in DynamoDB, never overwriting an existing tracking record
+            catalog_table.put_item(
+                Item=record.to_ddb_item(),
+                ConditionExpression='attribute_not_exists(tracking_id)'
+            )
             
             logger.info(
                 "Multipart upload initiated",
@@ -252,57 +370,10 @@ class UploadHandler:
             Dict with status and tracking_id
         """
         try:
-            # Validate at least one media key is provided
-            if not photo_key and not audio_key:
-                raise ValueError("At least one of photo_key or audio_key must be provided")
-            
-            # Fetch record from DynamoDB
-            response = catalog_table.get_item(Key={'tracking_id': tracking_id})
-            
-            if 'Item' not in response:
-                raise ValueError(f"Tracking ID {tracking_id} not found")
-            
-            record_data = response['Item']
-            
-            # Apply tenant-specific configuration
-            record_data = self._apply_tenant_configuration(
-                record_data.get('tenant_id', ''),
-                record_data
-            )
-            
-            # Update record with media keys and language
-            update_expression = "SET updated_at = :updated_at, #lang = :language"
-            expression_values = {
-                ':updated_at': datetime.utcnow().isoformat(),
-                ':language': language
-            }
-            expression_names = {'#lang': 'language'}
-            
-            if photo_key:
-                update_expression += ", photo_key = :photo_key"
-                expression_values[':photo_key'] = photo_key
-            
-            if audio_key:
-                update_expression += ", audio_key = :audio_key"
-                expression_values[':audio_key'] = audio_key
-            
-            catalog_table.update_item(
-                Key={'tracking_id': tracking_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeValues=expression_values,
-                ExpressionAttributeNames=expression_names
-            )
+            message = self._record_completion(tracking_id, photo_key, audio_key, language)
             
             # Publish message to SQS queue using the publisher
-            publish_result = sqs_publisher.publish_catalog_processing_message(
-                tracking_id=tracking_id,
-                tenant_id=record_data.get('tenant_id', ''),
-                artisan_id=record_data.get('artisan_id', ''),
-                photo_key=photo_key or record_data.get('photo_key', ''),
-                audio_key=audio_key or record_data.get('audio_key', ''),
-                language=language,
-                priority='normal'
-            )
+            publish_result = sqs_publisher.publish_catalog_processing_message(**message)
             
             logger.info(
                 "Upload completed and queued",
@@ -330,6 +401,151 @@ class UploadHandler:
             raise
     
     @tracer.capture_method
+    def complete_uploads(self, completions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Complete several uploads and queue them with SendMessageBatch
+        
+        Each upload is recorded on its own; those that succeed are published
+        together, so N completions cost ceil(N / 10) SQS requests.
+        
+        Args:
+            completions: Dicts with tracking_id, photo_key, audio_key and language
+            
+        Returns:
+            List of complete_upload results in input order, with status
+            'accepted' or 'failed'
+        """
+        results = []
+        messages = []
+        
+        for completion in completions:
+            tracking_id = completion['tracking_id']
+            try:
+                message = self._record_completion(
+                    tracking_id,
+                    completion.get('photo_key'),
+                    completion.get('audio_key'),
+                    completion.get('language', 'hi')
+                )
+            except ValueError as e:
+                logger.error(f"Validation error: {str(e)}")
+                results.append(self._completion_result(tracking_id, 'failed', str(e)))
+                continue
+            except Exception as e:
+                logger.error(f"Error completing upload: {str(e)}", exc_info=True)
+                results.append(self._completion_result(tracking_id, 'failed', "Failed to complete upload"))
+                continue
+            
+            results.append(None)
+            messages.append((len(results) - 1, message))
+        
+        if messages:
+            try:
+                publish_results = sqs_publisher.publish_catalog_processing_batch(
+                    [message for _, message in messages]
+                )
+            except Exception as e:
+                logger.error(f"Error queueing upload batch: {str(e)}", exc_info=True)
+                publish_results = [{'status': 'failed'}] * len(messages)
+            
+            for (index, message), publish_result in zip(messages, publish_results):
+                if publish_result['status'] == 'published':
+                    results[index] = self._completion_result(
+                        message['tracking_id'], 'accepted', "Upload accepted and queued for processing"
+                    )
+                else:
+                    results[index] = self._completion_result(
+                        message['tracking_id'],
+                        'failed',
+                        publish_result.get('error') or "Failed to queue upload for processing"
+                    )
+        
+        logger.info(
+            "Upload batch completed",
+            extra={
+                "count": len(results),
+                "accepted": sum(result['status'] == 'accepted' for result in results)
+            }
+        )
+        
+        return results
+    
+    def _record_completion(
+        self,
+        tracking_id: str,
+        photo_key: Optional[str],
+        audio_key: Optional[str],
+        language: str
+    ) -> Dict[str, Any]:
+        """
+        Store media keys and language on the tracking record
+        
+        Returns:
+            Keyword arguments for sqs_publisher.publish_catalog_processing_message
+            
+        Raises:
+            ValueError: If no media key is given or the tracking ID is unknown
+        """
+        # Validate at least one media key is provided
+        if not photo_key and not audio_key:
+            raise ValueError("At least one of photo_key or audio_key must be provided")
+        
+        # Update record with media keys and language
+        update_expression = COMPLETE_UPDATE_EXPRESSIONS[(bool(photo_key), bool(audio_key))]
+        expression_values = {
+            ':updated_at': datetime.utcnow().isoformat(),
+            ':language': language
+        }
+        
+        if photo_key:
+            expression_values[':photo_key'] = photo_key
+        
+        if audio_key:
+            expression_values[':audio_key'] = audio_key
+        
+        # Conditional update doubles as the existence check and returns
+        # the full record, saving a separate get_item round trip
+        try:
+            response = catalog_table.update_item(
+                Key={'tracking_id': tracking_id},
+                UpdateExpression=update_expression,
+                ConditionExpression='attribute_exists(tracking_id)',
+                ExpressionAttributeValues=expression_values,
+                ExpressionAttributeNames=COMPLETE_EXPRESSION_NAMES,
+                ReturnValues='ALL_NEW'
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise ValueError(f"Tracking ID {tracking_id} not found")
+            raise
+        
+        record_data = response['Attributes']
+        
+        # Apply tenant-specific configuration
+        record_data = self._apply_tenant_configuration(
+            record_data.get('tenant_id', ''),
+            record_data
+        )
+        
+        return {
+            'tracking_id': tracking_id,
+            'tenant_id': record_data.get('tenant_id', ''),
+            'artisan_id': record_data.get('artisan_id', ''),
+            'photo_key': photo_key or record_data.get('photo_key', ''),
+            'audio_key': audio_key or record_data.get('audio_key', ''),
+            'language': language,
+            'priority': 'normal'
+        }
+    
+    @staticmethod
+    def _completion_result(tracking_id: str, status: str, message: str) -> Dict[str, Any]:
+        """complete_upload style result for one upload"""
+        return {
+            "status": status,
+            "tracking_id": tracking_id,
+            "message": message
+        }
+    
     def get_status(self, tracking_id: str) -> Dict[str, Any]:
         """
         Get processing status for a tracking ID
@@ -357,7 +573,7 @@ class UploadHandler:
                 "tracking_id": tracking_id,
                 "stage": stage,
                 "message": message,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow()
             }
             
             # Add catalog ID if completed
@@ -390,40 +606,28 @@ class UploadHandler:
     
     def _determine_stage(self, record: Dict[str, Any]) -> str:
         """Determine current processing stage from record"""
-        # Check submission status first (final stage)
-        submission_status = record.get('submission_status', 'pending')
-        if submission_status == 'completed':
-            return 'completed'
-        elif submission_status == 'failed':
-            return 'failed'
-        
-        # Check other stages
-        mapping_status = record.get('mapping_status', 'pending')
-        extraction_status = record.get('extraction_status', 'pending')
-        vision_status = record.get('vision_status', 'pending')
-        asr_status = record.get('asr_status', 'pending')
-        
-        if mapping_status in ['in_progress', 'completed']:
-            return 'mapping'
-        elif extraction_status in ['in_progress', 'completed']:
-            return 'extraction'
-        elif vision_status in ['in_progress', 'completed'] or asr_status in ['in_progress', 'completed']:
-            return 'processing'
-        else:
-            return 'uploaded'
+        get = record.get
+        submission_status, mapping_status, extraction_status, vision_status, asr_status = (
+            get(key, 'pending') for key in STAGE_STATUS_KEYS
+        )
+        
+        # Terminal submission states take precedence over every other stage
+        match submission_status:
+            case 'completed' | 'failed':
+                return submission_status
+        
+        # One bit per pipeline stage that has started; the highest set bit
+        # is the furthest stage reached
+        mask = (
+            (mapping_status in ACTIVE_STATES) << 2
+            | (extraction_status in ACTIVE_STATES) << 1
+            | (vision_status in ACTIVE_STATES or asr_status in ACTIVE_STATES)
+        )
+        return PIPELINE_STAGES[mask.bit_length()]
     
     def _generate_status_message(self, stage: str, record: Dict[str, Any]) -> str:
         """Generate human-readable status message"""
-        messages = {
-            'uploaded': 'Media uploaded successfully, queued for processing',
-            'processing': 'Processing media with AI models',
-            'extraction': 'Extracting product attributes',
-            'mapping': 'Mapping to ONDC catalog format',
-            'completed': 'Catalog entry successfully published to ONDC',
-            'failed': 'Processing failed'
-        }
-        
-        message = messages.get(stage, 'Processing in progress')
+        message = STATUS_MESSAGES.get(stage, 'Processing in progress')
         
         # Add error details if failed
         if stage == 'failed' and record.get('error_details'):
@@ -903,7 +903,7 @@ def save_processing_record(record: CatalogProcessingRecord):
         table = dynamodb.Table(config.DYNAMODB_CATALOG_TABLE)
         record.updated_at = datetime.utcnow()
         
-        table.put_item(Item=json.loads(record.json()))
+        table.put_item(Item=record.to_ddb_item())
         
     except Exception as e:
         logger.error(f"Error saving processing record: {e}")
@@ -0,0 +1,39 @@
+"""
+Shared botocore client configuration and clients for Lambda functions
+"""
+from functools import cache
+import boto3
+from botocore.config import Config as BotoConfig
+
+from backend.lambda_functions.shared.config import config
+
+# Connection pooling, keepalive and adaptive retries for API-path clients.
+# Adaptive mode adds client-side rate limiting on top of exponential backoff,
+# which is what DynamoDB and SQS throttling responses call for.
+BOTO_CONFIG = BotoConfig(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=1,
+    read_timeout=5,
+    retries={
+        'max_attempts': 10,
+        'mode': 'adaptive'
+    }
+)
+
+
+@cache
+def get_client(service_name: str):
+    """
+    Return the process-wide boto3 client for a service
+    
+    Handlers and services share one client per service, so each service
+    model, signer and connection pool is built once per container.
+    """
+    return boto3.client(service_name, region_name=config.AWS_REGION, config=BOTO_CONFIG)
+
+
+@cache
+def get_resource(service_name: str):
+    """Return the process-wide boto3 resource for a service"""
+    return boto3.resource(service_name, region_name=config.AWS_REGION, config=BOTO_CONFIG)
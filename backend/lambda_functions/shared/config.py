@@ -38,12 +38,18 @@ class Config:
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
     MAX_UPLOAD_SIZE_MB: int = int(os.getenv('MAX_UPLOAD_SIZE_MB', '10'))
     SUPPORTED_LANGUAGES: str = os.getenv('SUPPORTED_LANGUAGES', 'hi,te,ta,bn,mr,gu,kn,ml,pa,or')
+    SUPPORTED_LANGUAGE_SET: frozenset[str] = frozenset(SUPPORTED_LANGUAGES.split(','))
     
     @classmethod
     def get_supported_languages(cls) -> list[str]:
         """Get list of supported languages"""
         return cls.SUPPORTED_LANGUAGES.split(',')
     
+    @classmethod
+    def is_supported_language(cls, language: str) -> bool:
+        """Check a language code against the supported set"""
+        return language in cls.SUPPORTED_LANGUAGE_SET
+    
     @classmethod
     def validate(cls) -> bool:
         """Validate required configuration"""
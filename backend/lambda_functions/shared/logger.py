@@ -2,9 +2,10 @@
 Logging configuration for Lambda functions
 """
 import logging
-import json
 import sys
+from datetime import datetime, timezone
 from typing import Any, Dict
+import orjson
 from .config import config
 
 
@@ -44,7 +45,7 @@ class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
         log_data: Dict[str, Any] = {
-            'timestamp': self.formatTime(record),
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -62,4 +63,5 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, 'tenant_id'):
             log_data['tenant_id'] = record.tenant_id
         
-        return json.dumps(log_data)
+        # orjson encodes the datetime natively; str() covers any other type
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_UTC_Z).decode()
@@ -22,25 +22,22 @@ from .catalog import (
     ONDCCatalogItem,
 )
 
-# Legacy models
-from .catalog import (
-    MediaFile,
-    VisionAnalysis,
-    ASRTranscription,
-    ONDCCatalogEntry,
-    CatalogRecord,
-)
-
 # Request models
 from .request import (
     CatalogSubmissionRequest,
+    UploadInitiateRequest,
+    UploadInitiateBatchRequest,
+    UploadCompleteRequest,
+    UploadCompleteBatchRequest,
     CatalogQueryRequest,
 )
 
 # Response models
 from .response import (
     UploadResponse,
+    UploadBatchResponse,
     UploadCompleteResponse,
+    UploadCompleteBatchResponse,
     StatusUpdate,
     ErrorDetail,
     ErrorResponse,
@@ -57,6 +54,8 @@ from .tenant import (
     TenantQuotaUsage,
 )
 
+from .catalog import _LEGACY_MODELS
+
 __all__ = [
     # Enums
     "ProcessingStatus",
@@ -74,7 +73,7 @@ __all__ = [
     "ItemDescriptor",
     "ONDCCatalogItem",
     
-    # Legacy models
+    # Legacy models (loaded lazily, see __getattr__)
     "MediaFile",
     "VisionAnalysis",
     "ASRTranscription",
@@ -83,11 +82,17 @@ __all__ = [
     
     # Request models
     "CatalogSubmissionRequest",
+    "UploadInitiateRequest",
+    "UploadInitiateBatchRequest",
+    "UploadCompleteRequest",
+    "UploadCompleteBatchRequest",
     "CatalogQueryRequest",
     
     # Response models
     "UploadResponse",
+    "UploadBatchResponse",
     "UploadCompleteResponse",
+    "UploadCompleteBatchResponse",
     "StatusUpdate",
     "ErrorDetail",
     "ErrorResponse",
@@ -101,3 +106,11 @@ __all__ = [
     "ArtisanProfile",
     "TenantQuotaUsage",
 ]
+
+
+def __getattr__(name):
+    # Legacy models are imported on first access only
+    if name in _LEGACY_MODELS:
+        from . import legacy
+        return getattr(legacy, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
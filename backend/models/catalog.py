@@ -4,7 +4,7 @@ Data models for catalog processing
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 
 
 class ProcessingStatus(str, Enum):
@@ -62,11 +62,6 @@ class LocalQueueEntry(BaseModel):
     last_retry_at: Optional[datetime] = Field(None, description="Last retry timestamp")
     tracking_id: Optional[str] = Field(None, description="Assigned after upload initiation")
     error_message: Optional[str] = Field(None, description="Error message if failed")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 # ============================================================================
@@ -108,10 +103,9 @@ class CatalogProcessingRecord(BaseModel):
     completed_at: Optional[datetime] = Field(None)
     error_details: Optional[Dict[str, Any]] = Field(None, description="Error details if failed")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    def to_ddb_item(self) -> Dict[str, Any]:
+        """DynamoDB item with ISO datetimes and enum values, unset optionals omitted"""
+        return self.model_dump(mode='json', exclude_none=True)
 
 
 # ============================================================================
@@ -172,26 +166,14 @@ class TimeRange(BaseModel):
 
 class ItemDescriptor(BaseModel):
     """Beckn protocol item descriptor"""
-    name: str = Field(..., description="Product name (max 100 chars)")
+    name: str = Field(..., max_length=100, description="Product name (max 100 chars)")
     code: Optional[str] = Field(None, description="Product code")
     symbol: Optional[str] = Field(None, description="Product symbol")
-    short_desc: str = Field(..., description="Short description (max 500 chars)")
+    short_desc: str = Field(..., max_length=500, description="Short description (max 500 chars)")
     long_desc: str = Field(..., description="Detailed description")
     images: List[str] = Field(default_factory=list, description="Image URLs")
     audio: Optional[str] = Field(None, description="Audio URL")
     video: Optional[str] = Field(None, description="Video URL")
-    
-    @validator('name')
-    def validate_name_length(cls, v):
-        if len(v) > 100:
-            raise ValueError("name must be <= 100 characters")
-        return v
-    
-    @validator('short_desc')
-    def validate_short_desc_length(cls, v):
-        if len(v) > 500:
-            raise ValueError("short_desc must be <= 500 characters")
-        return v
 
 
 class ONDCCatalogItem(BaseModel):
@@ -211,83 +193,19 @@ class ONDCCatalogItem(BaseModel):
     recommended: Optional[bool] = Field(None, description="Recommended flag")
 
 
-# ============================================================================
-# Legacy Models (for backward compatibility)
-# ============================================================================
-
-class MediaFile(BaseModel):
-    """Media file metadata"""
-    file_id: str = Field(..., description="Unique file identifier")
-    file_type: MediaType = Field(..., description="Type of media file")
-    s3_key: str = Field(..., description="S3 object key")
-    s3_bucket: str = Field(..., description="S3 bucket name")
-    file_size: int = Field(..., description="File size in bytes")
-    mime_type: str = Field(..., description="MIME type")
-    uploaded_at: datetime = Field(default_factory=datetime.utcnow)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
-
-class VisionAnalysis(BaseModel):
-    """Vision model analysis results"""
-    objects_detected: List[str] = Field(default_factory=list)
-    colors: List[str] = Field(default_factory=list)
-    materials: List[str] = Field(default_factory=list)
-    patterns: List[str] = Field(default_factory=list)
-    confidence_scores: Dict[str, float] = Field(default_factory=dict)
-    raw_output: Optional[Dict[str, Any]] = None
-
-
-class ASRTranscription(BaseModel):
-    """ASR transcription results"""
-    text: str = Field(..., description="Transcribed text")
-    language: LanguageCode = Field(..., description="Detected language")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
-    word_timestamps: Optional[List[Dict[str, Any]]] = None
-    raw_output: Optional[Dict[str, Any]] = None
-
-
-class ONDCCatalogEntry(BaseModel):
-    """ONDC-compliant catalog entry (legacy)"""
-    product_name: str = Field(..., description="Product name")
-    product_name_vernacular: Optional[str] = Field(None, description="Vernacular product name")
-    category: str = Field(..., description="ONDC category")
-    description: str = Field(..., description="Product description")
-    description_vernacular: Optional[str] = Field(None, description="Vernacular description")
-    attributes: Dict[str, Any] = Field(default_factory=dict, description="Product attributes")
-    price: Optional[float] = Field(None, description="Estimated price")
-    currency: str = Field("INR", description="Currency code")
-    images: List[str] = Field(default_factory=list, description="Image URLs")
-    cultural_context: Optional[str] = Field(None, description="Cultural significance")
+# Legacy models live in .legacy and are only imported (and their schemas
+# built) the first time one of them is accessed
+_LEGACY_MODELS = frozenset({
+    "MediaFile",
+    "VisionAnalysis",
+    "ASRTranscription",
+    "ONDCCatalogEntry",
+    "CatalogRecord",
+})
 
 
-class CatalogRecord(BaseModel):
-    """Complete catalog processing record (legacy)"""
-    catalog_id: str = Field(..., description="Unique catalog identifier")
-    tenant_id: str = Field(..., description="Tenant identifier")
-    status: ProcessingStatus = Field(default=ProcessingStatus.PENDING)
-    
-    # Input data
-    image_file: Optional[MediaFile] = None
-    audio_file: Optional[MediaFile] = None
-    language: LanguageCode = Field(..., description="Input language")
-    
-    # Processing results
-    vision_analysis: Optional[VisionAnalysis] = None
-    transcription: Optional[ASRTranscription] = None
-    catalog_entry: Optional[ONDCCatalogEntry] = None
-    
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-    processing_time_ms: Optional[int] = None
-    error_message: Optional[str] = None
-    retry_count: int = Field(default=0)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+def __getattr__(name):
+    if name in _LEGACY_MODELS:
+        from . import legacy
+        return getattr(legacy, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,78 @@
+"""
+Legacy catalog models (for backward compatibility)
+
+Imported lazily through backend.models / backend.models.catalog so that
+request paths which never touch them skip their schema build
+"""
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, Field
+from .catalog import ProcessingStatus, MediaType, LanguageCode
+
+
+class MediaFile(BaseModel):
+    """Media file metadata"""
+    file_id: str = Field(..., description="Unique file identifier")
+    file_type: MediaType = Field(..., description="Type of media file")
+    s3_key: str = Field(..., description="S3 object key")
+    s3_bucket: str = Field(..., description="S3 bucket name")
+    file_size: int = Field(..., description="File size in bytes")
+    mime_type: str = Field(..., description="MIME type")
+    uploaded_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class VisionAnalysis(BaseModel):
+    """Vision model analysis results"""
+    objects_detected: List[str] = Field(default_factory=list)
+    colors: List[str] = Field(default_factory=list)
+    materials: List[str] = Field(default_factory=list)
+    patterns: List[str] = Field(default_factory=list)
+    confidence_scores: Dict[str, float] = Field(default_factory=dict)
+    raw_output: Optional[Dict[str, Any]] = None
+
+
+class ASRTranscription(BaseModel):
+    """ASR transcription results"""
+    text: str = Field(..., description="Transcribed text")
+    language: LanguageCode = Field(..., description="Detected language")
+    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
+    word_timestamps: Optional[List[Dict[str, Any]]] = None
+    raw_output: Optional[Dict[str, Any]] = None
+
+
+class ONDCCatalogEntry(BaseModel):
+    """ONDC-compliant catalog entry (legacy)"""
+    product_name: str = Field(..., description="Product name")
+    product_name_vernacular: Optional[str] = Field(None, description="Vernacular product name")
+    category: str = Field(..., description="ONDC category")
+    description: str = Field(..., description="Product description")
+    description_vernacular: Optional[str] = Field(None, description="Vernacular description")
+    attributes: Dict[str, Any] = Field(default_factory=dict, description="Product attributes")
+    price: Optional[float] = Field(None, description="Estimated price")
+    currency: str = Field("INR", description="Currency code")
+    images: List[str] = Field(default_factory=list, description="Image URLs")
+    cultural_context: Optional[str] = Field(None, description="Cultural significance")
+
+
+class CatalogRecord(BaseModel):
+    """Complete catalog processing record (legacy)"""
+    catalog_id: str = Field(..., description="Unique catalog identifier")
+    tenant_id: str = Field(..., description="Tenant identifier")
+    status: ProcessingStatus = Field(default=ProcessingStatus.PENDING)
+    
+    # Input data
+    image_file: Optional[MediaFile] = None
+    audio_file: Optional[MediaFile] = None
+    language: LanguageCode = Field(..., description="Input language")
+    
+    # Processing results
+    vision_analysis: Optional[VisionAnalysis] = None
+    transcription: Optional[ASRTranscription] = None
+    catalog_entry: Optional[ONDCCatalogEntry] = None
+    
+    # Metadata
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    processing_time_ms: Optional[int] = None
+    error_message: Optional[str] = None
+    retry_count: int = Field(default=0)
@@ -1,26 +1,25 @@
 """
 API request models
 """
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, Optional, Dict, Any, List, Literal
+from pydantic import BaseModel, Field, StringConstraints
 from .catalog import LanguageCode
 
 
+# Shared constrained types; the limits are enforced by pydantic-core
+MAX_MEDIA_BYTES = 10 * 1024 * 1024  # 10MB limit
+Base64Media = Annotated[str, Field(max_length=MAX_MEDIA_BYTES)]
+TenantId = Annotated[str, StringConstraints(min_length=1, max_length=128, pattern=r"^[A-Za-z0-9_-]+$")]
+
+
 class CatalogSubmissionRequest(BaseModel):
     """Request model for catalog submission"""
-    tenant_id: str = Field(..., description="Tenant/artisan identifier")
+    tenant_id: TenantId = Field(..., description="Tenant/artisan identifier")
     language: LanguageCode = Field(..., description="Language of audio description")
-    image_data: Optional[str] = Field(None, description="Base64 encoded image data")
-    audio_data: Optional[str] = Field(None, description="Base64 encoded audio data")
+    image_data: Optional[Base64Media] = Field(None, description="Base64 encoded image data")
+    audio_data: Optional[Base64Media] = Field(None, description="Base64 encoded audio data")
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
     
-    @validator('image_data', 'audio_data')
-    def validate_media_data(cls, v):
-        """Validate that at least one media type is provided"""
-        if v and len(v) > 10 * 1024 * 1024:  # 10MB limit
-            raise ValueError("Media data exceeds 10MB limit")
-        return v
-    
     class Config:
         json_schema_extra = {
             "example": {
@@ -36,6 +35,73 @@ class CatalogSubmissionRequest(BaseModel):
         }
 
 
+# MIME types accepted for resumable uploads
+UploadContentType = Literal['image/jpeg', 'image/png', 'audio/opus', 'audio/mpeg', 'audio/wav']
+
+
+class UploadInitiateRequest(BaseModel):
+    """Request model for upload initiation"""
+    tenant_id: str = Field(..., alias="tenantId", min_length=1, description="Tenant organization identifier")
+    artisan_id: str = Field(..., alias="artisanId", min_length=1, description="Artisan identifier")
+    content_type: UploadContentType = Field(..., alias="contentType", description="MIME type of the upload")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "tenantId": "tenant_001",
+                "artisanId": "artisan_12345",
+                "contentType": "image/jpeg"
+            }
+        }
+
+
+class UploadCompleteRequest(BaseModel):
+    """Request model for upload completion"""
+    tracking_id: str = Field(..., alias="trackingId", min_length=1, description="Tracking identifier from initiate")
+    photo_key: Optional[str] = Field(None, alias="photoKey", description="S3 key for photo")
+    audio_key: Optional[str] = Field(None, alias="audioKey", description="S3 key for audio")
+    language: str = Field("hi", description="Language code")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "trackingId": "trk_abc123xyz",
+                "photoKey": "tenant_001/artisan_12345/trk_abc123xyz.jpg",
+                "language": "hi"
+            }
+        }
+
+
+class UploadInitiateBatchRequest(BaseModel):
+    """Request model for initiating several uploads at once"""
+    uploads: List[UploadInitiateRequest] = Field(..., min_length=1, max_length=25, description="Uploads to initiate")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "uploads": [
+                    {"tenantId": "tenant_001", "artisanId": "artisan_12345", "contentType": "image/jpeg"},
+                    {"tenantId": "tenant_001", "artisanId": "artisan_12345", "contentType": "audio/opus"}
+                ]
+            }
+        }
+
+
+class UploadCompleteBatchRequest(BaseModel):
+    """Request model for completing several uploads at once"""
+    uploads: List[UploadCompleteRequest] = Field(..., min_length=1, max_length=25, description="Uploads to complete")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "uploads": [
+                    {"trackingId": "trk_abc123xyz", "photoKey": "tenant_001/artisan_12345/trk_abc123xyz.jpg"},
+                    {"trackingId": "trk_def456uvw", "audioKey": "tenant_001/artisan_12345/trk_def456uvw.opus", "language": "ta"}
+                ]
+            }
+        }
+
+
 class CatalogQueryRequest(BaseModel):
     """Request model for querying catalog status"""
     catalog_id: Optional[str] = Field(None, description="Specific catalog ID")
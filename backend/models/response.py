@@ -18,9 +18,8 @@ class UploadResponse(BaseModel):
     expires_at: datetime = Field(..., description="Upload URL expiration timestamp")
     
     class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "tracking_id": "trk_abc123xyz",
@@ -30,6 +29,15 @@ class UploadResponse(BaseModel):
         }
 
 
+class UploadBatchResponse(BaseModel):
+    """Response for batch upload initiation"""
+    uploads: List[UploadResponse] = Field(..., description="Initiated uploads, in request order")
+    
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
 class UploadCompleteResponse(BaseModel):
     """Response for upload completion"""
     status: str = Field(default="accepted", description="Acceptance status")
@@ -37,6 +45,8 @@ class UploadCompleteResponse(BaseModel):
     message: str = Field(default="Upload accepted and queued for processing")
     
     class Config:
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "status": "accepted",
@@ -46,6 +56,17 @@ class UploadCompleteResponse(BaseModel):
         }
 
 
+class UploadCompleteBatchResponse(BaseModel):
+    """Response for batch upload completion"""
+    uploads: List[UploadCompleteResponse] = Field(
+        ..., description="Per-upload outcome ('accepted' or 'failed'), in request order"
+    )
+    
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
 # ============================================================================
 # Status Update Models
 # ============================================================================
@@ -59,9 +80,8 @@ class StatusUpdate(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
     class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "tracking_id": "trk_abc123xyz",
@@ -82,6 +102,10 @@ class ErrorDetail(BaseModel):
     field: Optional[str] = Field(None, description="Field that caused the error")
     issue: str = Field(..., description="Description of the issue")
     code: Optional[str] = Field(None, description="Error code")
+    
+    class Config:
+        frozen = True
+        extra = "forbid"
 
 
 class ErrorResponse(BaseModel):
@@ -138,11 +162,6 @@ class CatalogStatusResponse(BaseModel):
     processing_time_ms: Optional[int] = None
     error_message: Optional[str] = None
     catalog_entry: Optional[Dict[str, Any]] = None
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class CatalogListResponse(BaseModel):
@@ -175,8 +194,3 @@ class HealthCheckResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     version: str = Field(default="1.0.0")
     services: Dict[str, str] = Field(default_factory=dict)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
@@ -35,11 +35,6 @@ class TenantConfiguration(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = Field(default=True, description="Whether tenant is active")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class ArtisanProfile(BaseModel):
@@ -75,11 +70,6 @@ class ArtisanProfile(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     last_active_at: Optional[datetime] = Field(None, description="Last activity timestamp")
     is_active: bool = Field(default=True, description="Whether artisan profile is active")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class TenantQuotaUsage(BaseModel):
@@ -99,8 +89,3 @@ class TenantQuotaUsage(BaseModel):
     
     # Metadata
     updated_at: datetime = Field(default_factory=datetime.utcnow)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
@@ -1,15 +1,186 @@
 """
 AWS Bedrock Client for LLM inference
 """
-import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from models import ExtractedAttributes, CSI
 
 logger = logging.getLogger(__name__)
 
+# Pool leaves room for threads sharing the cached client; read_timeout stays at
+# botocore's 60s default because long completions legitimately take tens of seconds
+BEDROCK_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=60,
+    retries={
+        'max_attempts': 3,
+        'mode': 'standard'
+    }
+)
+
+# bedrock-runtime clients keyed by region, shared by every BedrockClient so
+# the service model, signer and HTTPS connection pool are built once
+_CLIENT_CACHE: Dict[str, Any] = {}
+
+
+def _get_runtime_client(region: str):
+    """Return the shared bedrock-runtime client for a region"""
+    client = _CLIENT_CACHE.get(region)
+    if client is None:
+        client = _CLIENT_CACHE.setdefault(region, boto3.client(
+            'bedrock-runtime',
+            region_name=region,
+            config=BEDROCK_CLIENT_CONFIG
+        ))
+    return client
+
+
+def extract_json(text: str, open_char: str, close_char: str) -> Any:
+    """
+    Parse the outermost open_char...close_char JSON value in an LLM completion
+    
+    find/rfind stop at the first match from each end, so they only scan the
+    prose around the JSON; the value itself is read once, by orjson.
+    
+    Raises:
+        ValueError: If no parseable JSON is found
+    """
+    start_idx = text.find(open_char)
+    end_idx = text.rfind(close_char) + 1
+    return orjson.loads(text[start_idx:end_idx])
+
+
+def _build_claude_3_body(prompt: str, max_tokens: int) -> bytes:
+    """Claude 3 uses the Messages API"""
+    return orjson.dumps({
+        'anthropic_version': 'bedrock-2023-05-31',
+        'max_tokens': max_tokens,
+        'messages': [
+            {
+                'role': 'user',
+                'content': prompt
+            }
+        ],
+        'temperature': 0.7,
+        'top_p': 0.9,
+    })
+
+
+def _parse_claude_3_response(response_body: Dict[str, Any]) -> str:
+    return response_body['content'][0]['text']
+
+
+def _build_claude_body(prompt: str, max_tokens: int) -> bytes:
+    """Claude 2 uses the legacy text completion format"""
+    return orjson.dumps({
+        'prompt': f'\n\nHuman: {prompt}\n\nAssistant:',
+        'max_tokens_to_sample': max_tokens,
+        'temperature': 0.7,
+        'top_p': 0.9,
+    })
+
+
+def _parse_claude_response(response_body: Dict[str, Any]) -> str:
+    return response_body['completion']
+
+
+def _build_titan_body(prompt: str, max_tokens: int) -> bytes:
+    """Titan and other models"""
+    return orjson.dumps({
+        'inputText': prompt,
+        'textGenerationConfig': {
+            'maxTokenCount': max_tokens,
+            'temperature': 0.7,
+            'topP': 0.9,
+        }
+    })
+
+
+def _parse_titan_response(response_body: Dict[str, Any]) -> str:
+    return response_body['results'][0]['outputText']
+
+
+# Request body builder and response parser per model family, chosen once per
+# BedrockClient so _invoke_model does not re-check the model ID on every call
+MODEL_FAMILIES: Dict[str, Tuple[Callable[[str, int], bytes], Callable[[Dict[str, Any]], str]]] = {
+    'claude-3': (_build_claude_3_body, _parse_claude_3_response),
+    'claude': (_build_claude_body, _parse_claude_response),
+    'titan': (_build_titan_body, _parse_titan_response),
+}
+
+
+def _detect_family(model_id: str) -> str:
+    """Map a Bedrock model ID to its MODEL_FAMILIES key"""
+    if 'claude-3' in model_id:
+        return 'claude-3'
+    if 'claude' in model_id:
+        return 'claude'
+    return 'titan'
+
+
+# Prompt templates, filled with str.format (literal braces are doubled)
+CATALOG_PROMPT_TEMPLATE = """You are an expert at converting vernacular product descriptions into structured ONDC catalog entries.
+
+Language: {language}
+Transcription: {transcription}
+Vision Analysis: {vision_json}
+
+Generate a structured catalog entry with:
+1. Product name (preserve vernacular terms)
+2. Category (ONDC taxonomy)
+3. Description (bilingual: vernacular + English)
+4. Attributes (color, material, size, etc.)
+5. Price estimation (if mentioned)
+6. Cultural context preservation
+
+Output as JSON."""
+
+ATTRIBUTE_EXTRACTION_PROMPT_TEMPLATE = """You are an expert at extracting structured product attributes from multimodal artisan product descriptions.
+
+LANGUAGE: {language}
+
+VOICE TRANSCRIPTION (AUTHORITATIVE):
+{transcription}
+
+VISION ANALYSIS:
+{vision_json}
+
+TASK: Extract comprehensive product attributes following these rules:
+
+1. CONFLICT RESOLUTION: If voice and vision disagree, ALWAYS prioritize voice transcription
+2. CULTURAL PRESERVATION: Identify and preserve culturally significant terms (craft techniques, regional names, traditional materials)
+3. PRICE EXTRACTION: Extract price with currency normalization (e.g., "पांच सौ रुपये" → {{"value": 500, "currency": "INR"}})
+4. CONFIDENCE SCORING: Provide confidence (0.0-1.0) for each extracted attribute
+
+OUTPUT FORMAT (JSON):
+{{
+  "category": "string (e.g., 'Handloom Saree', 'Pottery', 'Jewelry')",
+  "subcategory": "string or null",
+  "material": ["list of materials"],
+  "colors": ["list of colors"],
+  "dimensions": {{"length": number, "width": number, "height": number, "unit": "string"}} or null,
+  "weight": {{"value": number, "unit": "string"}} or null,
+  "price": {{"value": number, "currency": "string"}} or null,
+  "short_description": "1-2 sentence description",
+  "long_description": "Detailed description preserving cultural context",
+  "craft_technique": "string or null (e.g., 'Handwoven on pit loom')",
+  "region_of_origin": "string or null (e.g., 'Varanasi, Uttar Pradesh')",
+  "confidence_scores": {{
+    "category": 0.0-1.0,
+    "material": 0.0-1.0,
+    "colors": 0.0-1.0,
+    "price": 0.0-1.0
+  }}
+}}
+
+Extract attributes now:"""
+
 
 class BedrockClient:
     """Client for AWS Bedrock LLM services"""
@@ -23,7 +194,8 @@ class BedrockClient:
             region: AWS region
         """
         self.model_id = model_id
-        self.client = boto3.client('bedrock-runtime', region_name=region)
+        self._build_body, self._parse_response = MODEL_FAMILIES[_detect_family(model_id)]
+        self.client = _get_runtime_client(region)
         logger.info(f"Initialized Bedrock client with model: {model_id}")
     
     def generate_catalog_entry(
@@ -155,53 +327,14 @@ class BedrockClient:
         Returns:
             Model response text
         """
-        if 'claude-3' in self.model_id:
-            # Claude 3 uses Messages API
-            body = json.dumps({
-                'anthropic_version': 'bedrock-2023-05-31',
-                'max_tokens': max_tokens,
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'temperature': 0.7,
-                'top_p': 0.9,
-            })
-        elif 'claude' in self.model_id:
-            # Claude 2 uses legacy format
-            body = json.dumps({
-                'prompt': f'\n\nHuman: {prompt}\n\nAssistant:',
-                'max_tokens_to_sample': max_tokens,
-                'temperature': 0.7,
-                'top_p': 0.9,
-            })
-        else:  # Titan or other models
-            body = json.dumps({
-                'inputText': prompt,
-                'textGenerationConfig': {
-                    'maxTokenCount': max_tokens,
-                    'temperature': 0.7,
-                    'topP': 0.9,
-                }
-            })
-        
         response = self.client.invoke_model(
             modelId=self.model_id,
-            body=body,
+            body=self._build_body(prompt, max_tokens),
             contentType='application/json',
             accept='application/json'
         )
         
-        response_body = json.loads(response['body'].read())
-        
-        if 'claude-3' in self.model_id:
-            return response_body['content'][0]['text']
-        elif 'claude' in self.model_id:
-            return response_body['completion']
-        else:
-            return response_body['results'][0]['outputText']
+        return self._parse_response(orjson.loads(response['body'].read()))
     
     def _build_catalog_prompt(
         self,
@@ -210,21 +343,11 @@ class BedrockClient:
         language: str
     ) -> str:
         """Build prompt for catalog generation"""
-        return f"""You are an expert at converting vernacular product descriptions into structured ONDC catalog entries.
-
-Language: {language}
-Transcription: {transcription}
-Vision Analysis: {json.dumps(vision_data, indent=2)}
-
-Generate a structured catalog entry with:
-1. Product name (preserve vernacular terms)
-2. Category (ONDC taxonomy)
-3. Description (bilingual: vernacular + English)
-4. Attributes (color, material, size, etc.)
-5. Price estimation (if mentioned)
-6. Cultural context preservation
-
-Output as JSON."""
+        return CATALOG_PROMPT_TEMPLATE.format(
+            language=language,
+            transcription=transcription,
+            vision_json=orjson.dumps(vision_data, option=orjson.OPT_INDENT_2).decode()
+        )
     
     def _build_attribute_extraction_prompt(
         self,
@@ -233,45 +356,11 @@ Output as JSON."""
         language: str
     ) -> str:
         """Build prompt for comprehensive attribute extraction"""
-        return f"""You are an expert at extracting structured product attributes from multimodal artisan product descriptions.
-
-LANGUAGE: {language}
-
-VOICE TRANSCRIPTION (AUTHORITATIVE):
-{transcription}
-
-VISION ANALYSIS:
-{json.dumps(vision_data, indent=2)}
-
-TASK: Extract comprehensive product attributes following these rules:
-
-1. CONFLICT RESOLUTION: If voice and vision disagree, ALWAYS prioritize voice transcription
-2. CULTURAL PRESERVATION: Identify and preserve culturally significant terms (craft techniques, regional names, traditional materials)
-3. PRICE EXTRACTION: Extract price with currency normalization (e.g., "पांच सौ रुपये" → {{"value": 500, "currency": "INR"}})
-4. CONFIDENCE SCORING: Provide confidence (0.0-1.0) for each extracted attribute
-
-OUTPUT FORMAT (JSON):
-{{
-  "category": "string (e.g., 'Handloom Saree', 'Pottery', 'Jewelry')",
-  "subcategory": "string or null",
-  "material": ["list of materials"],
-  "colors": ["list of colors"],
-  "dimensions": {{"length": number, "width": number, "height": number, "unit": "string"}} or null,
-  "weight": {{"value": number, "unit": "string"}} or null,
-  "price": {{"value": number, "currency": "string"}} or null,
-  "short_description": "1-2 sentence description",
-  "long_description": "Detailed description preserving cultural context",
-  "craft_technique": "string or null (e.g., 'Handwoven on pit loom')",
-  "region_of_origin": "string or null (e.g., 'Varanasi, Uttar Pradesh')",
-  "confidence_scores": {{
-    "category": 0.0-1.0,
-    "material": 0.0-1.0,
-    "colors": 0.0-1.0,
-    "price": 0.0-1.0
-  }}
-}}
-
-Extract attributes now:"""
+        return ATTRIBUTE_EXTRACTION_PROMPT_TEMPLATE.format(
+            language=language,
+            transcription=transcription,
+            vision_json=orjson.dumps(vision_data, option=orjson.OPT_INDENT_2).decode()
+        )
     
     def _build_csi_identification_prompt(
         self,
@@ -352,12 +441,8 @@ Generate transcreated descriptions now:"""
     def _parse_catalog_response(self, response: str) -> Dict[str, Any]:
         """Parse LLM response into structured catalog entry"""
         try:
-            # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            json_str = response[start_idx:end_idx]
-            return json.loads(json_str)
-        except (ValueError, json.JSONDecodeError) as e:
+            return extract_json(response, '{', '}')
+        except ValueError as e:
             logger.error(f"Error parsing catalog response: {e}")
             return {
                 'raw_response': response,
@@ -367,11 +452,7 @@ Generate transcreated descriptions now:"""
     def _parse_attributes_response(self, response: str) -> ExtractedAttributes:
         """Parse LLM response into ExtractedAttributes model"""
         try:
-            # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            json_str = response[start_idx:end_idx]
-            data = json.loads(json_str)
+            data = extract_json(response, '{', '}')
             
             # Create ExtractedAttributes from parsed data
             return ExtractedAttributes(
@@ -389,7 +470,7 @@ Generate transcreated descriptions now:"""
                 region_of_origin=data.get('region_of_origin'),
                 confidence_scores=data.get('confidence_scores', {})
             )
-        except (ValueError, json.JSONDecodeError) as e:
+        except ValueError as e:
             logger.error(f"Error parsing attributes response: {e}")
             # Return minimal valid ExtractedAttributes
             return ExtractedAttributes(
@@ -402,11 +483,7 @@ Generate transcreated descriptions now:"""
     def _parse_csi_response(self, response: str) -> List[CSI]:
         """Parse LLM response into list of CSI objects"""
         try:
-            # Extract JSON array from response
-            start_idx = response.find('[')
-            end_idx = response.rfind(']') + 1
-            json_str = response[start_idx:end_idx]
-            data = json.loads(json_str)
+            data = extract_json(response, '[', ']')
             
             # Create CSI objects
             csi_list = []
@@ -420,24 +497,20 @@ Generate transcreated descriptions now:"""
                 csi_list.append(csi)
             
             return csi_list
-        except (ValueError, json.JSONDecodeError) as e:
+        except ValueError as e:
             logger.error(f"Error parsing CSI response: {e}")
             return []
     
     def _parse_transcreation_response(self, response: str) -> Dict[str, str]:
         """Parse LLM response into transcreated descriptions"""
         try:
-            # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            json_str = response[start_idx:end_idx]
-            data = json.loads(json_str)
+            data = extract_json(response, '{', '}')
             
             return {
                 'short_description': data.get('short_description', ''),
                 'long_description': data.get('long_description', '')
             }
-        except (ValueError, json.JSONDecodeError) as e:
+        except ValueError as e:
             logger.error(f"Error parsing transcreation response: {e}")
             return {
                 'short_description': 'Product description unavailable',
@@ -26,7 +26,7 @@ class SubmissionStatus(str, Enum):
     EXHAUSTED = "exhausted"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogEntry:
     """Represents a single audit log entry for ONDC submission"""
     tracking_id: str
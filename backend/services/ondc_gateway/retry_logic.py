@@ -34,7 +34,7 @@ class ErrorCategory(str, Enum):
     VALIDATION = "validation"
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryState:
     """Represents the retry state for a submission"""
     tracking_id: str
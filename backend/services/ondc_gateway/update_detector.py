@@ -18,7 +18,7 @@ from backend.models.catalog import ExtractedAttributes, ONDCCatalogItem
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalogVersion:
     """Represents a version of a catalog entry"""
     version_number: int
@@ -44,7 +44,7 @@ class CatalogVersion:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateDetectionResult:
     """Result of update detection"""
     is_update: bool
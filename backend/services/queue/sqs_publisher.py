@@ -2,18 +2,26 @@
 SQS Message Publisher with idempotency and error handling
 Implements Requirements 3.4, 9.1
 """
-import json
 import hashlib
 from datetime import datetime
-from typing import Dict, Any, Optional
-import boto3
-from botocore.exceptions import ClientError
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
+from botocore.exceptions import BotoCoreError, ClientError
 from aws_lambda_powertools import Logger
 
 from backend.lambda_functions.shared.config import config
+from backend.lambda_functions.shared.aws import get_client
 
 logger = Logger()
 
+# SendMessageBatch limits: 10 entries and 256 KiB total payload per request
+SQS_BATCH_MAX_ENTRIES = 10
+SQS_BATCH_MAX_BYTES = 256 * 1024
+
+REQUIRED_MESSAGE_FIELDS = ('trackingId', 'tenantId', 'artisanId', 'language')
+VALID_PRIORITIES = ('normal', 'high', 'low')
+VALID_PRIORITY_SET = frozenset(VALID_PRIORITIES)
+
 
 class SQSPublisher:
     """
@@ -27,7 +35,7 @@ class SQSPublisher:
     """
     
     def __init__(self):
-        self.sqs_client = boto3.client('sqs', region_name=config.AWS_REGION)
+        self.sqs_client = get_client('sqs')
         self.queue_url = config.SQS_QUEUE_URL
     
     def publish_catalog_processing_message(
@@ -58,61 +66,12 @@ class SQSPublisher:
             Dict with message_id and status
         """
         try:
-            # Generate idempotency key for deduplication
-            idempotency_key = self._generate_idempotency_key(
-                tracking_id, tenant_id, artisan_id
+            idempotency_key, entry = self._build_catalog_processing_entry(
+                tracking_id, tenant_id, artisan_id, photo_key, audio_key,
+                language, priority, metadata
             )
             
-            # Build message body
-            message_body = {
-                "trackingId": tracking_id,
-                "tenantId": tenant_id,
-                "artisanId": artisan_id,
-                "photoKey": photo_key,
-                "audioKey": audio_key,
-                "language": language,
-                "priority": priority,
-                "timestamp": datetime.utcnow().isoformat(),
-                "metadata": metadata or {}
-            }
-            
-            # Validate message
-            self._validate_message(message_body)
-            
-            # Serialize message
-            message_json = json.dumps(message_body)
-            
-            # Determine if queue is FIFO
-            is_fifo = self.queue_url.endswith('.fifo')
-            
-            # Prepare send message parameters
-            send_params = {
-                'QueueUrl': self.queue_url,
-                'MessageBody': message_json,
-                'MessageAttributes': {
-                    'TrackingId': {
-                        'StringValue': tracking_id,
-                        'DataType': 'String'
-                    },
-                    'TenantId': {
-                        'StringValue': tenant_id,
-                        'DataType': 'String'
-                    },
-                    'Priority': {
-                        'StringValue': priority,
-                        'DataType': 'String'
-                    },
-                    'Language': {
-                        'StringValue': language,
-                        'DataType': 'String'
-                    }
-                }
-            }
-            
-            # Add FIFO-specific parameters
-            if is_fifo:
-                send_params['MessageDeduplicationId'] = idempotency_key
-                send_params['MessageGroupId'] = tenant_id  # Group by tenant for ordering
+            send_params = {'QueueUrl': self.queue_url, **entry}
             
             # Send message to SQS
             response = self.sqs_client.send_message(**send_params)
@@ -153,6 +112,169 @@ class SQSPublisher:
             )
             raise
     
+    def publish_catalog_processing_batch(
+        self,
+        messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Publish several catalog processing messages with SendMessageBatch
+        
+        Args:
+            messages: Keyword arguments for publish_catalog_processing_message,
+                one dict per message
+            
+        Returns:
+            List of per-message results in input order, with status
+            'published' or 'failed'. Messages that fail validation are not
+            sent and carry the validation error.
+        """
+        prepared = []
+        for message in messages:
+            try:
+                idempotency_key, entry = self._build_catalog_processing_entry(**message)
+            except ValueError as e:
+                prepared.append((None, {
+                    'message_id': None,
+                    'idempotency_key': None,
+                    'status': 'failed',
+                    'tracking_id': message['tracking_id'],
+                    'error': str(e)
+                }))
+                continue
+            prepared.append((entry, {
+                'message_id': None,
+                'idempotency_key': idempotency_key,
+                'status': 'pending',
+                'tracking_id': message['tracking_id']
+            }))
+        
+        return self._publish_entries(prepared)
+    
+    def publish_status_update_batch(
+        self,
+        updates: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Publish several status update messages with SendMessageBatch
+        
+        Args:
+            updates: Keyword arguments for publish_status_update, one dict
+                per update
+            
+        Returns:
+            List of per-update results in input order, with status
+            'published' or 'failed'. A batch request that raises ClientError
+            or BotoCoreError fails only its own updates; the rest are still sent.
+        """
+        prepared = [
+            (self._build_status_update_entry(**update), {
+                'message_id': None,
+                'status': 'pending',
+                'tracking_id': update['tracking_id']
+            })
+            for update in updates
+        ]
+        
+        return self._publish_entries(prepared)
+    
+    def _publish_entries(
+        self,
+        prepared: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send (entry, result) pairs in batches of at most 10 messages and
+        256 KiB, so N messages cost ceil(N / 10) requests instead of N.
+        Pairs without an entry have already failed and are not sent.
+        """
+        results: List[Dict[str, Any]] = []
+        batch: List[Dict[str, Any]] = []
+        batch_bytes = 0
+        
+        for index, (entry, result) in enumerate(prepared):
+            if entry is None:
+                results.append(result)
+                continue
+            
+            entry['Id'] = str(index)
+            entry_bytes = self._entry_size(entry)
+            
+            if batch and (
+                len(batch) == SQS_BATCH_MAX_ENTRIES
+                or batch_bytes + entry_bytes > SQS_BATCH_MAX_BYTES
+            ):
+                self._send_batch(batch, results)
+                batch, batch_bytes = [], 0
+            
+            batch.append(entry)
+            batch_bytes += entry_bytes
+            results.append(result)
+        
+        if batch:
+            self._send_batch(batch, results)
+        
+        return results
+    
+    def _send_batch(self, entries: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> None:
+        """
+        Send one SendMessageBatch request and record per-entry outcomes
+        
+        A failed request (service error, connection failure or timeout)
+        marks only its own entries as failed, so results of batches already
+        sent are kept and later batches still go out.
+        """
+        try:
+            response = self.sqs_client.send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=entries
+            )
+        except (ClientError, BotoCoreError) as e:
+            # BotoCoreError covers connection failures and read timeouts
+            if isinstance(e, ClientError):
+                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            else:
+                error_code = type(e).__name__
+            logger.error(
+                f"AWS error publishing message batch: {error_code}",
+                extra={"batch_size": len(entries), "error": str(e)},
+                exc_info=True
+            )
+            for entry in entries:
+                result = results[int(entry['Id'])]
+                result['status'] = 'failed'
+                result['error'] = error_code
+            return
+        
+        for success in response.get('Successful', []):
+            result = results[int(success['Id'])]
+            result['message_id'] = success.get('MessageId')
+            result['status'] = 'published'
+        
+        for failure in response.get('Failed', []):
+            result = results[int(failure['Id'])]
+            result['status'] = 'failed'
+            result['error'] = failure.get('Message', failure.get('Code'))
+            logger.error(
+                "Message in batch failed to publish",
+                extra={"tracking_id": result['tracking_id'], "code": failure.get('Code')}
+            )
+        
+        logger.info(
+            "Message batch published to SQS",
+            extra={
+                "batch_size": len(entries),
+                "failed": len(response.get('Failed', [])),
+                "queue_url": self.queue_url
+            }
+        )
+    
+    @staticmethod
+    def _entry_size(entry: Dict[str, Any]) -> int:
+        """Approximate SQS payload size of an entry (body plus attributes)"""
+        size = len(entry['MessageBody'].encode())
+        for name, attribute in entry['MessageAttributes'].items():
+            size += len(name) + len(attribute['DataType']) + len(attribute['StringValue'].encode())
+        return size
+    
     def publish_status_update(
         self,
         tracking_id: str,
@@ -177,43 +299,13 @@ class SQSPublisher:
             Dict with message_id and status
         """
         try:
-            # Build message body
-            message_body = {
-                "trackingId": tracking_id,
-                "stage": stage,
-                "status": status,
-                "message": message,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            if catalog_id:
-                message_body['catalogId'] = catalog_id
-            
-            if error_details:
-                message_body['errorDetails'] = error_details
-            
-            # Serialize message
-            message_json = json.dumps(message_body)
-            
             # Send to status update queue (or SNS topic)
             # For now, using the same queue with different message attributes
             response = self.sqs_client.send_message(
                 QueueUrl=self.queue_url,
-                MessageBody=message_json,
-                MessageAttributes={
-                    'MessageType': {
-                        'StringValue': 'StatusUpdate',
-                        'DataType': 'String'
-                    },
-                    'TrackingId': {
-                        'StringValue': tracking_id,
-                        'DataType': 'String'
-                    },
-                    'Stage': {
-                        'StringValue': stage,
-                        'DataType': 'String'
-                    }
-                }
+                **self._build_status_update_entry(
+                    tracking_id, stage, status, message, catalog_id, error_details
+                )
             )
             
             logger.info(
@@ -238,6 +330,116 @@ class SQSPublisher:
             )
             raise
     
+    def _build_status_update_entry(
+        self,
+        tracking_id: str,
+        stage: str,
+        status: str,
+        message: str,
+        catalog_id: Optional[str] = None,
+        error_details: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build SendMessage parameters (without QueueUrl) for a status update"""
+        message_body = {
+            "trackingId": tracking_id,
+            "stage": stage,
+            "status": status,
+            "message": message,
+            "timestamp": datetime.utcnow()
+        }
+        
+        if catalog_id:
+            message_body['catalogId'] = catalog_id
+        
+        if error_details:
+            message_body['errorDetails'] = error_details
+        
+        return {
+            # orjson writes the datetime as ISO 8601
+            'MessageBody': orjson.dumps(message_body).decode(),
+            'MessageAttributes': {
+                'MessageType': {
+                    'StringValue': 'StatusUpdate',
+                    'DataType': 'String'
+                },
+                'TrackingId': {
+                    'StringValue': tracking_id,
+                    'DataType': 'String'
+                },
+                'Stage': {
+                    'StringValue': stage,
+                    'DataType': 'String'
+                }
+            }
+        }
+    
+    def _build_catalog_processing_entry(
+        self,
+        tracking_id: str,
+        tenant_id: str,
+        artisan_id: str,
+        photo_key: str,
+        audio_key: str,
+        language: str,
+        priority: str = 'normal',
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build validated SendMessage parameters (without QueueUrl)
+        
+        Returns:
+            Tuple of (idempotency_key, message parameters)
+        """
+        # Generate idempotency key for deduplication
+        idempotency_key = self._generate_idempotency_key(
+            tracking_id, tenant_id, artisan_id
+        )
+        
+        # Build message body
+        message_body = {
+            "trackingId": tracking_id,
+            "tenantId": tenant_id,
+            "artisanId": artisan_id,
+            "photoKey": photo_key,
+            "audioKey": audio_key,
+            "language": language,
+            "priority": priority,
+            "timestamp": datetime.utcnow(),
+            "metadata": metadata or {}
+        }
+        
+        # Validate message
+        self._validate_message(message_body)
+        
+        entry = {
+            'MessageBody': orjson.dumps(message_body).decode(),
+            'MessageAttributes': {
+                'TrackingId': {
+                    'StringValue': tracking_id,
+                    'DataType': 'String'
+                },
+                'TenantId': {
+                    'StringValue': tenant_id,
+                    'DataType': 'String'
+                },
+                'Priority': {
+                    'StringValue': priority,
+                    'DataType': 'String'
+                },
+                'Language': {
+                    'StringValue': language,
+                    'DataType': 'String'
+                }
+            }
+        }
+        
+        # Add FIFO-specific parameters
+        if self.queue_url.endswith('.fifo'):
+            entry['MessageDeduplicationId'] = idempotency_key
+            entry['MessageGroupId'] = tenant_id  # Group by tenant for ordering
+        
+        return idempotency_key, entry
+    
     def _generate_idempotency_key(
         self, 
         tracking_id: str, 
@@ -253,10 +455,10 @@ class SQSPublisher:
             artisan_id: Artisan identifier
             
         Returns:
-            SHA-256 hash as idempotency key
+            32-hex-char BLAKE2b digest as idempotency key
         """
         key_input = f"{tracking_id}|{tenant_id}|{artisan_id}"
-        return hashlib.sha256(key_input.encode()).hexdigest()[:32]
+        return hashlib.blake2b(key_input.encode(), digest_size=16).hexdigest()
     
     def _validate_message(self, message: Dict[str, Any]) -> None:
         """
@@ -268,10 +470,8 @@ class SQSPublisher:
         Raises:
             ValueError: If message is invalid
         """
-        required_fields = ['trackingId', 'tenantId', 'artisanId', 'language']
-        
-        for field in required_fields:
-            if field not in message or not message[field]:
+        for field in REQUIRED_MESSAGE_FIELDS:
+            if not message.get(field):
                 raise ValueError(f"Required field '{field}' is missing or empty")
         
         # Validate at least one media key is present
@@ -279,19 +479,17 @@ class SQSPublisher:
             raise ValueError("At least one of 'photoKey' or 'audioKey' must be provided")
         
         # Validate language code
-        supported_languages = config.get_supported_languages()
-        if message['language'] not in supported_languages:
+        if not config.is_supported_language(message['language']):
             raise ValueError(
                 f"Unsupported language '{message['language']}'. "
-                f"Supported: {', '.join(supported_languages)}"
+                f"Supported: {', '.join(config.get_supported_languages())}"
             )
         
         # Validate priority
-        valid_priorities = ['normal', 'high', 'low']
-        if message.get('priority') and message['priority'] not in valid_priorities:
+        if message.get('priority') and message['priority'] not in VALID_PRIORITY_SET:
             raise ValueError(
                 f"Invalid priority '{message['priority']}'. "
-                f"Valid values: {', '.join(valid_priorities)}"
+                f"Valid values: {', '.join(VALID_PRIORITIES)}"
             )
 
 
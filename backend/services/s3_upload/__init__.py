@@ -3,5 +3,6 @@ S3 Upload Service
 Provides multipart upload with presigned URLs and resume capability
 """
 from .multipart_upload import MultipartUploadManager, multipart_upload_manager
+from .presigner import S3Presigner
 
-__all__ = ['MultipartUploadManager', 'multipart_upload_manager']
+__all__ = ['MultipartUploadManager', 'multipart_upload_manager', 'S3Presigner']
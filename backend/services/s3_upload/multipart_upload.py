@@ -2,17 +2,48 @@
 S3 Multipart Upload Manager with presigned URLs and resume capability
 Implements Requirements 3.2, 3.3
 """
-import json
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-import boto3
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 from botocore.exceptions import ClientError
 from aws_lambda_powertools import Logger
 
 from backend.lambda_functions.shared.config import config
+from backend.lambda_functions.shared.aws import get_client, get_resource
+from .presigner import S3Presigner
 
 logger = Logger()
 
+# File extension for each accepted content type
+EXTENSION_MAP = MappingProxyType({
+    'image/jpeg': 'jpg',
+    'image/png': 'png',
+    'audio/opus': 'opus',
+    'audio/mpeg': 'mp3',
+    'audio/wav': 'wav'
+})
+
+# Validity of presigned part URLs, in seconds (1 hour)
+PART_URL_EXPIRES_IN = 3600
+
+# Parts set per update_item; keeps the UpdateExpression well under
+# DynamoDB's 4 KB expression limit
+PART_UPDATE_BATCH_SIZE = 100
+
+
+def _completed_parts_map(completed_parts) -> Dict[str, str]:
+    """
+    completed_parts as a part number (str) -> ETag map
+    
+    Upload states written before the map layout hold a list of
+    {'part_number', 'etag'} entries; both forms are accepted.
+    """
+    if completed_parts is None:
+        return {}
+    if isinstance(completed_parts, list):
+        return {str(int(part['part_number'])): part['etag'] for part in completed_parts}
+    return completed_parts
+
 
 class MultipartUploadManager:
     """
@@ -26,10 +57,11 @@ class MultipartUploadManager:
     """
     
     def __init__(self):
-        self.s3_client = boto3.client('s3', region_name=config.AWS_REGION)
-        self.dynamodb = boto3.resource('dynamodb', region_name=config.AWS_REGION)
+        self.s3_client = get_client('s3')
+        self.dynamodb = get_resource('dynamodb')
         self.raw_bucket = config.S3_RAW_MEDIA_BUCKET
         self.upload_state_table = self.dynamodb.Table(f"{config.DYNAMODB_CATALOG_TABLE}_UploadState")
+        self.presigner = S3Presigner(self.s3_client, self.raw_bucket)
     
     def initiate_multipart_upload(
         self, 
@@ -56,14 +88,7 @@ class MultipartUploadManager:
         """
         try:
             # Determine file extension
-            extension_map = {
-                'image/jpeg': 'jpg',
-                'image/png': 'png',
-                'audio/opus': 'opus',
-                'audio/mpeg': 'mp3',
-                'audio/wav': 'wav'
-            }
-            extension = extension_map.get(content_type, 'bin')
+            extension = EXTENSION_MAP.get(content_type, 'bin')
             
             # Generate S3 key with tenant isolation
             s3_key = f"{tenant_id}/{artisan_id}/{tracking_id}.{extension}"
@@ -86,25 +111,15 @@ class MultipartUploadManager:
             num_parts = (file_size + part_size - 1) // part_size
             
             # Generate presigned URLs for each part (valid for 1 hour)
-            expires_in = 3600
-            part_urls = []
-            
-            for part_number in range(1, num_parts + 1):
-                presigned_url = self.s3_client.generate_presigned_url(
-                    'upload_part',
-                    Params={
-                        'Bucket': self.raw_bucket,
-                        'Key': s3_key,
-                        'UploadId': upload_id,
-                        'PartNumber': part_number
-                    },
-                    ExpiresIn=expires_in
-                )
-                
-                part_urls.append({
+            expires_in = PART_URL_EXPIRES_IN
+            upload_part_url = self.presigner.upload_part_url
+            part_urls = [
+                {
                     'part_number': part_number,
-                    'url': presigned_url
-                })
+                    'url': upload_part_url(s3_key, upload_id, part_number, expires_in)
+                }
+                for part_number in range(1, num_parts + 1)
+            ]
             
             # Store upload state in DynamoDB
             now = datetime.utcnow()
@@ -119,7 +134,7 @@ class MultipartUploadManager:
                 'file_size': file_size,
                 'part_size': part_size,
                 'num_parts': num_parts,
-                'completed_parts': [],
+                'completed_parts': {},  # part number (str) -> ETag
                 'status': 'initiated',
                 'created_at': now.isoformat(),
                 'expires_at': expires_at.isoformat()
@@ -170,40 +185,46 @@ class MultipartUploadManager:
         Returns:
             Dict with updated upload state
         """
-        try:
-            # Fetch upload state
-            response = self.upload_state_table.get_item(Key={'tracking_id': tracking_id})
-            
-            if 'Item' not in response:
-                raise ValueError(f"Upload state not found for tracking_id: {tracking_id}")
-            
-            upload_state = response['Item']
+        return self.record_parts_completion(tracking_id, [(part_number, etag)])
+    
+    def record_parts_completion(
+        self,
+        tracking_id: str,
+        parts: List[Tuple[int, str]]
+    ) -> Dict[str, Any]:
+        """
+        Record completion of several upload parts
+        
+        Each update_item sets up to PART_UPDATE_BATCH_SIZE entries of the
+        completed_parts map instead of one write per part. A part listed
+        more than once (a client retry) keeps its last ETag, since DynamoDB
+        rejects two SET actions on the same document path.
+        
+        Args:
+            tracking_id: Tracking identifier
+            parts: (part_number, etag) pairs
             
-            # Add completed part
-            completed_parts = upload_state.get('completed_parts', [])
+        Returns:
+            Dict with updated upload state
+        """
+        try:
+            parts = list({int(part_number): etag for part_number, etag in parts}.items())
+            upload_state = None
+            for start in range(0, len(parts), PART_UPDATE_BATCH_SIZE):
+                upload_state = self._set_completed_parts(
+                    tracking_id, parts[start:start + PART_UPDATE_BATCH_SIZE]
+                )
             
-            # Check if part already recorded
-            if not any(p['part_number'] == part_number for p in completed_parts):
-                completed_parts.append({
-                    'part_number': part_number,
-                    'etag': etag
-                })
+            if upload_state is None:
+                raise ValueError("No parts to record")
             
-            # Update state
-            self.upload_state_table.update_item(
-                Key={'tracking_id': tracking_id},
-                UpdateExpression="SET completed_parts = :parts, updated_at = :updated_at",
-                ExpressionAttributeValues={
-                    ':parts': completed_parts,
-                    ':updated_at': datetime.utcnow().isoformat()
-                }
-            )
+            completed_parts = _completed_parts_map(upload_state.get('completed_parts'))
             
             logger.info(
                 "Part completion recorded",
                 extra={
                     "tracking_id": tracking_id,
-                    "part_number": part_number,
+                    "parts_recorded": len(parts),
                     "completed_parts": len(completed_parts),
                     "total_parts": upload_state['num_parts']
                 }
@@ -226,6 +247,107 @@ class MultipartUploadManager:
             logger.error(f"Error recording part: {str(e)}", exc_info=True)
             raise
     
+    def _set_completed_parts(
+        self,
+        tracking_id: str,
+        parts: List[Tuple[int, str]],
+        migrate_legacy: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Set the given parts' entries in the completed_parts map
+        
+        The condition doubles as the existence check, and concurrent part
+        completions no longer overwrite each other's lists. States still in
+        the legacy list layout fail the map-type condition and are converted
+        on this first touch.
+        
+        Returns:
+            The full upload state after the update
+        """
+        assignments = []
+        names = {}
+        values = {
+            ':updated_at': datetime.utcnow().isoformat(),
+            ':map_type': 'M'
+        }
+        for index, (part_number, etag) in enumerate(parts):
+            assignments.append(f"completed_parts.#p{index} = :e{index}")
+            names[f'#p{index}'] = str(part_number)
+            values[f':e{index}'] = etag
+        
+        try:
+            response = self.upload_state_table.update_item(
+                Key={'tracking_id': tracking_id},
+                UpdateExpression=f"SET {', '.join(assignments)}, updated_at = :updated_at",
+                ConditionExpression='attribute_exists(tracking_id) AND attribute_type(completed_parts, :map_type)',
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                ReturnValues='ALL_NEW'
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            if migrate_legacy:
+                return self._migrate_completed_parts(tracking_id, parts)
+            raise ValueError(f"Upload state not found for tracking_id: {tracking_id}")
+        
+        return response['Attributes']
+    
+    def _migrate_completed_parts(
+        self,
+        tracking_id: str,
+        parts: List[Tuple[int, str]]
+    ) -> Dict[str, Any]:
+        """
+        Rewrite a legacy list-form completed_parts as a map, adding parts
+        
+        Conditional on the list being unchanged; if another writer got there
+        first the parts are set on the map it wrote.
+        
+        Returns:
+            The full upload state after the update
+        """
+        response = self.upload_state_table.get_item(
+            Key={'tracking_id': tracking_id},
+            ConsistentRead=True
+        )
+        if 'Item' not in response:
+            raise ValueError(f"Upload state not found for tracking_id: {tracking_id}")
+        
+        legacy_parts = response['Item'].get('completed_parts')
+        completed_parts = dict(_completed_parts_map(legacy_parts))
+        completed_parts.update((str(part_number), etag) for part_number, etag in parts)
+        
+        values = {
+            ':parts': completed_parts,
+            ':updated_at': datetime.utcnow().isoformat()
+        }
+        if legacy_parts is None:
+            condition = 'attribute_not_exists(completed_parts)'
+        else:
+            condition = 'completed_parts = :legacy'
+            values[':legacy'] = legacy_parts
+        
+        try:
+            response = self.upload_state_table.update_item(
+                Key={'tracking_id': tracking_id},
+                UpdateExpression="SET completed_parts = :parts, updated_at = :updated_at",
+                ConditionExpression=condition,
+                ExpressionAttributeValues=values,
+                ReturnValues='ALL_NEW'
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            return self._set_completed_parts(tracking_id, parts, migrate_legacy=False)
+        
+        logger.info(
+            "Converted legacy completed_parts list to map",
+            extra={"tracking_id": tracking_id, "completed_parts": len(completed_parts)}
+        )
+        
+        return response['Attributes']
+    
     def get_upload_state(self, tracking_id: str) -> Dict[str, Any]:
         """
         Get current upload state for resume capability
@@ -245,10 +367,12 @@ class MultipartUploadManager:
             upload_state = response['Item']
             
             # Determine which parts still need to be uploaded
-            completed_part_numbers = [p['part_number'] for p in upload_state.get('completed_parts', [])]
+            completed_parts = _completed_parts_map(upload_state.get('completed_parts'))
+            completed_part_numbers = sorted(int(pn) for pn in completed_parts)
+            completed_set = set(completed_part_numbers)
             pending_parts = [
                 i for i in range(1, upload_state['num_parts'] + 1) 
-                if i not in completed_part_numbers
+                if i not in completed_set
             ]
             
             return {
@@ -293,14 +417,14 @@ class MultipartUploadManager:
             upload_state = response['Item']
             
             # Verify all parts are completed
-            completed_parts = upload_state.get('completed_parts', [])
+            completed_parts = _completed_parts_map(upload_state.get('completed_parts'))
             if len(completed_parts) != upload_state['num_parts']:
                 raise ValueError(
                     f"Not all parts uploaded: {len(completed_parts)}/{upload_state['num_parts']}"
                 )
             
             # Sort parts by part number
-            parts = sorted(completed_parts, key=lambda x: x['part_number'])
+            parts = sorted((int(pn), etag) for pn, etag in completed_parts.items())
             
             # Complete multipart upload
             response = self.s3_client.complete_multipart_upload(
@@ -310,10 +434,10 @@ class MultipartUploadManager:
                 MultipartUpload={
                     'Parts': [
                         {
-                            'PartNumber': part['part_number'],
-                            'ETag': part['etag']
+                            'PartNumber': part_number,
+                            'ETag': etag
                         }
-                        for part in parts
+                        for part_number, etag in parts
                     ]
                 }
             )
@@ -15,14 +15,25 @@ import json
 import logging
 import time
 import base64
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union
 from enum import Enum
 import boto3
+from cachetools import TTLCache
 from botocore.exceptions import ClientError, ReadTimeoutError, ConnectTimeoutError
 from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Single-modality requests carry the raw media as the request body instead of
+# base64 inside JSON; a language hint is passed as a content-type parameter
+IMAGE_CONTENT_TYPE = 'application/x-image'
+AUDIO_CONTENT_TYPE = 'application/x-audio'
+
+
+def _media_content_type(media_type: str, language_hint: Optional[str]) -> str:
+    """Content type for a raw media body, with the language hint if one was given"""
+    return f"{media_type}; language={language_hint}" if language_hint else media_type
+
 
 class ErrorCategory(Enum):
     """Error categories for retry logic"""
@@ -49,6 +60,9 @@ class SagemakerClient:
     INITIAL_RETRY_DELAY = 1  # seconds
     MAX_RETRY_DELAY = 10  # seconds
     
+    # How long a describe_endpoint status is reused by health_check
+    HEALTH_CHECK_TTL_SECONDS = 30
+    
     def __init__(
         self,
         endpoint_name: Optional[str] = None,
@@ -75,10 +89,13 @@ class SagemakerClient:
         self.asr_confidence_threshold = asr_confidence_threshold
         self.vision_confidence_threshold = vision_confidence_threshold
         
-        # Configure boto3 client with timeout
+        # Configure boto3 client with timeout; the larger keep-alive pool lets
+        # concurrent ~1s inferences share a client without waiting for sockets
         config = Config(
             read_timeout=timeout_seconds,
             connect_timeout=10,
+            max_pool_connections=50,
+            tcp_keepalive=True,
             retries={'max_attempts': 0}  # We handle retries manually
         )
         
@@ -88,6 +105,11 @@ class SagemakerClient:
             config=config
         )
         
+        # Control-plane client for health_check, created on first use
+        self.region = region
+        self._sagemaker_client = None
+        self._endpoint_status_cache = TTLCache(maxsize=16, ttl=self.HEALTH_CHECK_TTL_SECONDS)
+        
         logger.info(
             f"Initialized Sagemaker client for endpoint: {endpoint_name}, "
             f"timeout: {timeout_seconds}s, max_retries: {max_retries}"
@@ -117,34 +139,46 @@ class SagemakerClient:
         if image_bytes is None and audio_bytes is None:
             raise ValueError("At least one of image_bytes or audio_bytes must be provided")
         
-        # Prepare payload
-        payload = {
-            'task': 'multimodal_analysis'
-        }
-        
-        if image_bytes:
-            payload['image'] = base64.b64encode(image_bytes).decode('utf-8')
-        
-        if audio_bytes:
-            payload['audio'] = base64.b64encode(audio_bytes).decode('utf-8')
-        
-        if language_hint:
-            payload['language_hint'] = language_hint
+        # Without a hint the endpoint applies its own default, as for JSON
+        # requests that omit language_hint
+        if image_bytes and not audio_bytes:
+            body = image_bytes
+            content_type = _media_content_type(IMAGE_CONTENT_TYPE, language_hint)
+        elif audio_bytes and not image_bytes:
+            body = audio_bytes
+            content_type = _media_content_type(AUDIO_CONTENT_TYPE, language_hint)
+        else:
+            # Prepare payload
+            payload = {
+                'task': 'multimodal_analysis'
+            }
+            
+            if image_bytes:
+                payload['image'] = base64.b64encode(image_bytes).decode('utf-8')
+            
+            if audio_bytes:
+                payload['audio'] = base64.b64encode(audio_bytes).decode('utf-8')
+            
+            if language_hint:
+                payload['language_hint'] = language_hint
+            
+            body, content_type = json.dumps(payload), 'application/json'
         
         # Invoke with retry logic
-        result = self._invoke_with_retry(payload)
+        result = self._invoke_with_retry(body, content_type)
         
         # Flag low confidence results
         result = self._flag_low_confidence(result)
         
         return result
     
-    def _invoke_with_retry(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _invoke_with_retry(self, body: Union[bytes, str], content_type: str) -> Dict[str, Any]:
         """
         Invoke endpoint with exponential backoff retry logic
         
         Args:
-            payload: Request payload
+            body: Request body
+            content_type: Request content type
             
         Returns:
             Response from endpoint
@@ -161,8 +195,8 @@ class SagemakerClient:
                 
                 response = self.client.invoke_endpoint(
                     EndpointName=self.endpoint_name,
-                    ContentType='application/json',
-                    Body=json.dumps(payload)
+                    ContentType=content_type,
+                    Body=body
                 )
                 
                 result = json.loads(response['Body'].read().decode())
@@ -316,16 +350,25 @@ class SagemakerClient:
         """
         Check if Sagemaker endpoint is healthy
         
+        The endpoint status is reused for HEALTH_CHECK_TTL_SECONDS; errors
+        are not cached.
+        
         Returns:
             True if endpoint is healthy, False otherwise
         """
+        status = self._endpoint_status_cache.get(self.endpoint_name)
+        if status is not None:
+            return status == 'InService'
+        
         try:
-            sagemaker_client = boto3.client('sagemaker')
-            response = sagemaker_client.describe_endpoint(
+            if self._sagemaker_client is None:
+                self._sagemaker_client = boto3.client('sagemaker', region_name=self.region)
+            response = self._sagemaker_client.describe_endpoint(
                 EndpointName=self.endpoint_name
             )
             status = response['EndpointStatus']
             logger.info(f"Endpoint status: {status}")
+            self._endpoint_status_cache[self.endpoint_name] = status
             return status == 'InService'
             
         except ClientError as e:
@@ -47,6 +47,15 @@ def input_fn(request_body: bytes, content_type: str = 'application/json'):
     """
     Preprocess input data
     
+    Accepted content types:
+    - application/json: {image, audio (base64), language_hint, task}
+    - application/x-image: raw image bytes
+    - application/x-audio: raw audio bytes
+    
+    The raw media types take the language hint as a content-type parameter,
+    e.g. 'application/x-audio; language=ta'. Whatever the content type, a
+    request without a hint is processed with 'hi'.
+    
     Args:
         request_body: Raw request body
         content_type: Content type of the request
@@ -56,7 +65,27 @@ def input_fn(request_body: bytes, content_type: str = 'application/json'):
     """
     logger.info(f"Processing input with content type: {content_type}")
     
-    if content_type != 'application/json':
+    media_type, _, params = content_type.partition(';')
+    media_type = media_type.strip()
+    
+    # Single-modality requests send the raw media bytes as the body
+    if media_type == 'application/x-image':
+        return {
+            'image': preprocess_image(request_body),
+            'audio': None,
+            'language_hint': _language_param(params),
+            'task': 'multimodal_analysis'
+        }
+    
+    if media_type == 'application/x-audio':
+        return {
+            'image': None,
+            'audio': preprocess_audio(request_body),
+            'language_hint': _language_param(params),
+            'task': 'multimodal_analysis'
+        }
+    
+    if media_type != 'application/json':
         raise ValueError(f"Unsupported content type: {content_type}")
     
     # Parse JSON payload
@@ -84,6 +113,15 @@ def input_fn(request_body: bytes, content_type: str = 'application/json'):
     }
 
 
+def _language_param(params: str, default: str = 'hi') -> str:
+    """Read the language parameter from content-type parameters"""
+    for param in params.split(';'):
+        name, _, value = param.partition('=')
+        if name.strip() == 'language' and value.strip():
+            return value.strip()
+    return default
+
+
 def predict_fn(input_data: Dict[str, Any], model):
     """
     Run inference on the preprocessed input
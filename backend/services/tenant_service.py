@@ -2,15 +2,14 @@
 Tenant configuration service for multi-tenancy support
 Implements tenant data isolation, configuration management, and quota enforcement
 """
-import json
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-import boto3
 from botocore.exceptions import ClientError
 from aws_lambda_powertools import Logger
 
 from backend.models.tenant import TenantConfiguration, ArtisanProfile, TenantQuotaUsage
 from backend.lambda_functions.shared.config import config
+from backend.lambda_functions.shared.aws import get_resource
 
 logger = Logger()
 
@@ -19,7 +18,7 @@ class TenantService:
     """Service for managing tenant configurations and data isolation"""
     
     def __init__(self):
-        self.dynamodb = boto3.resource('dynamodb', region_name=config.AWS_REGION)
+        self.dynamodb = get_resource('dynamodb')
         self.tenant_table = self.dynamodb.Table(config.DYNAMODB_TENANT_TABLE)
         self.catalog_table = self.dynamodb.Table(config.DYNAMODB_CATALOG_TABLE)
     
@@ -60,7 +59,7 @@ class TenantService:
         """
         try:
             # Convert to dict and store in DynamoDB
-            item = json.loads(tenant_config.json())
+            item = tenant_config.model_dump(mode='json')
             
             self.tenant_table.put_item(
                 Item=item,
@@ -4,10 +4,20 @@ Creates the directory structure and initial files for the Vernacular Artisan Cat
 """
 
 import os
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+
+def create_init_file(directory):
+    """Create an empty __init__.py in directory; return its path if it was new"""
+    init_file = os.path.join(directory, "__init__.py")
+    if os.path.lexists(init_file):
+        return None
+    os.close(os.open(init_file, os.O_CREAT | os.O_WRONLY, 0o644))
+    return init_file
+
 
 def create_directory_structure():
-    """Create the project directory structure."""
+    """Create the project directory structure and package __init__.py files."""
     
     directories = [
         "backend/lambda_functions/api_handlers",
@@ -27,34 +37,34 @@ def create_directory_structure():
         "scripts",
     ]
     
-    print("Creating directory structure...")
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        # Create __init__.py for Python packages
-        if directory.startswith("backend/"):
-            init_file = Path(directory) / "__init__.py"
-            init_file.touch()
-        print(f"✓ Created {directory}")
-    
-    print("\n✅ Directory structure created successfully!")
-
-def create_init_files():
-    """Create __init__.py files to make directories Python packages."""
-    
-    python_dirs = [
+    # Directories that are Python packages and need an __init__.py
+    python_dirs = {
         "backend",
         "backend/lambda_functions",
         "backend/models",
         "backend/services",
         "tests",
-    ]
+    }
+    python_dirs.update(d for d in directories if d.startswith("backend/"))
+    
+    # Only leaves need creating: os.makedirs builds their ancestors
+    all_dirs = set(directories) | python_dirs
+    leaves = {d for d in all_dirs if not any(o.startswith(d + "/") for o in all_dirs)}
     
-    print("\nCreating __init__.py files...")
-    for directory in python_dirs:
-        init_file = Path(directory) / "__init__.py"
-        if not init_file.exists():
-            init_file.touch()
-            print(f"✓ Created {init_file}")
+    print("Creating directory structure...")
+    # mkdir/open are syscall-bound, so overlap them; exist_ok keeps shared
+    # ancestors safe and map() keeps the output order deterministic
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leaves = sorted(leaves)
+        list(executor.map(lambda d: os.makedirs(d, exist_ok=True), leaves))
+        for directory in leaves:
+            print(f"✓ Created {directory}")
+        
+        for init_file in executor.map(create_init_file, sorted(python_dirs)):
+            if init_file:
+                print(f"✓ Created {init_file}")
+    
+    print("\n✅ Directory structure created successfully!")
 
 if __name__ == "__main__":
     print("=" * 60)
@@ -63,7 +73,6 @@ if __name__ == "__main__":
     print()
     
     create_directory_structure()
-    create_init_files()
     
     print("\n" + "=" * 60)
     print("Next Steps:")
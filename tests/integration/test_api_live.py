@@ -0,0 +1,110 @@
+"""
+Live API Tests
+
+Exercises the local API server over HTTP. Start the server first:
+    uvicorn backend.lambda_functions.api_handlers.local_server:app --reload
+
+The tests are independent apart from submit -> status, so they can be
+distributed across workers:
+    pytest -n auto tests/integration/test_api_live.py
+"""
+
+import base64
+import socket
+from typing import Generator
+from urllib.parse import urlsplit
+
+import orjson
+import pytest
+import requests
+
+BASE_URL = "http://localhost:8000"
+
+# (connect, read) seconds so a wedged server can't hang the run
+TIMEOUT = (2.0, 10.0)
+
+# Mock base64 media, encoded once
+MOCK_IMAGE_B64 = base64.b64encode(b"fake_image_data").decode()
+MOCK_AUDIO_B64 = base64.b64encode(b"fake_audio_data").decode()
+
+SUBMIT_PAYLOAD = {
+    "tenant_id": "artisan_001",
+    "language": "hi",
+    "image_data": MOCK_IMAGE_B64,
+    "audio_data": MOCK_AUDIO_B64,
+    "metadata": {
+        "location": "Jaipur",
+        "category_hint": "handicraft"
+    }
+}
+
+
+def server_reachable(timeout: float = 0.2) -> bool:
+    """Fast TCP probe of BASE_URL before any HTTP request is made"""
+    url = urlsplit(BASE_URL)
+    try:
+        with socket.create_connection((url.hostname, url.port or 80), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+pytestmark = pytest.mark.skipif(
+    not server_reachable(),
+    reason=f"Local API server not running at {BASE_URL}"
+)
+
+
+def response_json(response: requests.Response):
+    """Decode a response body with orjson rather than requests' stdlib json"""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def client() -> Generator[requests.Session, None, None]:
+    """One keep-alive session per test process"""
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def submitted_catalog_id(client: requests.Session) -> str:
+    """Submit a catalog once and share its ID"""
+    response = client.post(f"{BASE_URL}/catalog", json=SUBMIT_PAYLOAD, timeout=TIMEOUT)
+    assert response.status_code == 202
+
+    return response_json(response)["catalog_id"]
+
+
+def test_health_check(client: requests.Session):
+    """Test health check endpoint"""
+    response = client.get(f"{BASE_URL}/health", timeout=TIMEOUT)
+    assert response.status_code == 200
+
+
+def test_submit_catalog(submitted_catalog_id: str):
+    """Test catalog submission"""
+    assert submitted_catalog_id
+
+
+def test_get_catalog_status(client: requests.Session, submitted_catalog_id: str):
+    """Test getting catalog status"""
+    response = client.get(f"{BASE_URL}/catalog/{submitted_catalog_id}", timeout=TIMEOUT)
+    assert response.status_code == 200
+
+
+def test_list_catalogs(client: requests.Session):
+    """Test listing catalogs"""
+    response = client.get(f"{BASE_URL}/catalog?limit=10", timeout=TIMEOUT)
+    assert response.status_code == 200
+
+
+def test_validation_error(client: requests.Session):
+    """Test validation error handling"""
+    # Missing required field
+    payload = {
+        "language": "hi"
+    }
+
+    response = client.post(f"{BASE_URL}/catalog", json=payload, timeout=TIMEOUT)
+    assert response.status_code == 422  # FastAPI validation error
@@ -0,0 +1,14 @@
+"""
+Shared fixtures for unit tests
+"""
+import datetime
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture
+def frozen_clock():
+    """Pin botocore's SigV2 expiry clock and SigV4 request date"""
+    with patch('botocore.auth.time.time', return_value=1704067200), \
+            patch('botocore.auth.get_current_datetime', return_value=datetime.datetime(2024, 1, 1)):
+        yield
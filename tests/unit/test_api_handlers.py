@@ -0,0 +1,476 @@
+"""
+Unit tests for the API Gateway handler routes
+"""
+import orjson
+import pytest
+import boto3
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError, EndpointConnectionError
+from cachetools import TTLCache
+from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
+from backend.lambda_functions.api_handlers import main, upload_handlers
+
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def status_result(tracking_id, stage, catalog_id=None):
+    """upload_handler.get_status output"""
+    return {
+        'tracking_id': tracking_id,
+        'stage': stage,
+        'message': f"Stage: {stage}",
+        'catalog_id': catalog_id,
+        'timestamp': NOW
+    }
+
+
+class FakeClock:
+    """Manually advanced timer for TTLCache"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fresh status caches, with the in-flight cache on a fake clock"""
+    clock = FakeClock()
+    ttl_cache = TTLCache(
+        maxsize=main._status_cache.maxsize,
+        ttl=main._status_cache.ttl,
+        timer=clock
+    )
+    main._final_status_cache.clear()
+    with patch.object(main, '_status_cache', ttl_cache):
+        yield clock
+    main._final_status_cache.clear()
+
+
+@pytest.fixture
+def get_status():
+    """Mocked upload_handler.get_status"""
+    with patch.object(main.upload_handler, 'get_status') as get_status:
+        yield get_status
+
+
+def test_health_check():
+    """Test /health reports a timezone-aware UTC timestamp"""
+    body = main.health_check()
+
+    assert body["status"] == "healthy"
+    assert body["timestamp"].endswith("+00:00")
+
+
+class TestStatusCache:
+    """Test caching of serialized /v1/catalog/status bodies"""
+
+    def test_terminal_status_served_from_lru(self, clock, get_status):
+        """Test a completed status is fetched once and then served from the LRU"""
+        get_status.return_value = status_result("trk_done", "completed", "ondc_cat_1")
+
+        first = main.get_catalog_status_v1("trk_done")
+        clock.now += 3600
+        second = main.get_catalog_status_v1("trk_done")
+
+        assert get_status.call_count == 1
+        assert second == first
+        assert orjson.loads(first["body"])["catalog_id"] == "ondc_cat_1"
+        assert "trk_done" in main._final_status_cache
+
+    def test_in_progress_status_expires(self, clock, get_status):
+        """Test an in-flight status is reused within the TTL and refetched after it"""
+        get_status.side_effect = [
+            status_result("trk_busy", "asr_processing"),
+            status_result("trk_busy", "completed", "ondc_cat_2")
+        ]
+
+        first = main.get_catalog_status_v1("trk_busy")
+        assert main.get_catalog_status_v1("trk_busy") == first
+        assert get_status.call_count == 1
+        assert "trk_busy" not in main._final_status_cache
+
+        clock.now += main._status_cache.ttl + 0.1
+        refreshed = main.get_catalog_status_v1("trk_busy")
+
+        assert get_status.call_count == 2
+        assert orjson.loads(refreshed["body"])["stage"] == "completed"
+
+    def test_failed_status_expires(self, clock, get_status):
+        """Test a failed status is not pinned, so a redelivered retry can complete"""
+        get_status.side_effect = [
+            status_result("trk_retry", "failed"),
+            status_result("trk_retry", "completed", "ondc_cat_3")
+        ]
+
+        failed = orjson.loads(main.get_catalog_status_v1("trk_retry")["body"])
+        assert "trk_retry" not in main._final_status_cache
+
+        clock.now += main._status_cache.ttl + 0.1
+        completed = orjson.loads(main.get_catalog_status_v1("trk_retry")["body"])
+
+        assert failed["stage"] == "failed"
+        assert completed["stage"] == "completed"
+        assert completed["catalog_id"] == "ondc_cat_3"
+        assert get_status.call_count == 2
+
+    def test_tracking_ids_do_not_share_bodies(self, clock, get_status):
+        """Test each tracking id gets its own cached body"""
+        get_status.side_effect = lambda tracking_id: status_result(tracking_id, "completed")
+
+        bodies = {
+            tracking_id: orjson.loads(main.get_catalog_status_v1(tracking_id)["body"])
+            for tracking_id in ("trk_a", "trk_b")
+        }
+        repeated = orjson.loads(main.get_catalog_status_v1("trk_a")["body"])
+
+        assert bodies["trk_a"]["tracking_id"] == "trk_a"
+        assert bodies["trk_b"]["tracking_id"] == "trk_b"
+        assert repeated == bodies["trk_a"]
+        assert get_status.call_count == 2
+
+    def test_not_found_is_not_cached(self, clock, get_status):
+        """Test lookup failures are returned as 404 and retried next time"""
+        get_status.side_effect = ValueError("Status not found for tracking_id: trk_x")
+
+        assert main.get_catalog_status_v1("trk_x")["statusCode"] == 404
+        assert main.get_catalog_status_v1("trk_x")["statusCode"] == 404
+        assert get_status.call_count == 2
+
+
+def initiate_batch(uploads):
+    """Call the initiate-batch route with the given uploads as the request body"""
+    event = APIGatewayProxyEvent({
+        'httpMethod': "POST",
+        'path': "/v1/catalog/upload/initiate-batch",
+        'body': orjson.dumps({'uploads': uploads}).decode()
+    })
+    with patch.object(main.app, 'current_event', event, create=True):
+        return main.initiate_upload_batch()
+
+
+def batch_upload(index, content_type="image/jpeg"):
+    """One UploadInitiateRequest item"""
+    return {'tenantId': "tenant_001", 'artisanId': f"artisan_{index}", 'contentType': content_type}
+
+
+@pytest.fixture
+def catalog_table():
+    """Real Table resource with batch_write_item mocked, so batch_writer runs as in Lambda"""
+    table = boto3.resource(
+        'dynamodb',
+        region_name='ap-south-1',
+        aws_access_key_id='AKIDEXAMPLE',
+        aws_secret_access_key='secret'
+    ).Table("catalog-processing")
+    presigner = MagicMock()
+    presigner.put_object_url.side_effect = lambda key, content_type, expires_in: f"https://upload/{key}"
+    with patch.object(table.meta.client, 'batch_write_item', return_value={'UnprocessedItems': {}}), \
+            patch.object(upload_handlers, 'catalog_table', table), \
+            patch.object(main.upload_handler, 'presigner', presigner):
+        yield table
+
+
+def written_items(batch_write_item):
+    """Items put across all BatchWriteItem calls"""
+    return [
+        request['PutRequest']['Item']
+        for call in batch_write_item.call_args_list
+        for request in call.kwargs['RequestItems']["catalog-processing"]
+    ]
+
+
+class TestInitiateUploadBatch:
+    """Test POST /v1/catalog/upload/initiate-batch"""
+
+    def test_success(self, catalog_table):
+        """Test every upload gets a URL, in request order, from one batched write"""
+        uploads = [batch_upload(1), batch_upload(2, "audio/opus"), batch_upload(3, "image/png")]
+
+        response = initiate_batch(uploads)
+
+        assert response['statusCode'] == 200
+        results = orjson.loads(response['body'])['uploads']
+        assert [r['upload_url'].rsplit('.', 1)[1] for r in results] == ['jpg', 'opus', 'png']
+        assert [r['upload_url'].split('/')[4] for r in results] == ["artisan_1", "artisan_2", "artisan_3"]
+
+        batch_write_item = catalog_table.meta.client.batch_write_item
+        assert batch_write_item.call_count == 1
+        items = written_items(batch_write_item)
+        assert [item['tracking_id'] for item in items] == [r['tracking_id'] for r in results]
+        assert items[1]['audio_key'] and not items[1]['photo_key']
+
+    @pytest.mark.parametrize("count", [0, 26])
+    def test_size_limits(self, catalog_table, count):
+        """Test empty and over-25 batches are rejected before any write"""
+        response = initiate_batch([batch_upload(i) for i in range(count)])
+
+        assert response['statusCode'] == 400
+        assert orjson.loads(response['body'])['error'] == "ValidationError"
+        catalog_table.meta.client.batch_write_item.assert_not_called()
+
+    def test_max_batch_size(self, catalog_table):
+        """Test a full batch of 25 is accepted"""
+        response = initiate_batch([batch_upload(i) for i in range(25)])
+
+        assert response['statusCode'] == 200
+        assert len(orjson.loads(response['body'])['uploads']) == 25
+
+    def test_invalid_item_rejected(self, catalog_table):
+        """Test one bad content type fails the whole batch validation"""
+        response = initiate_batch([batch_upload(1), batch_upload(2, "video/mp4")])
+
+        assert response['statusCode'] == 400
+        catalog_table.meta.client.batch_write_item.assert_not_called()
+
+    def test_unprocessed_items_retried(self, catalog_table):
+        """Test items DynamoDB leaves unprocessed are resubmitted"""
+        batch_write_item = catalog_table.meta.client.batch_write_item
+
+        def partially_process(RequestItems):
+            if batch_write_item.call_count == 1:
+                return {'UnprocessedItems': {"catalog-processing": RequestItems["catalog-processing"][1:]}}
+            return {'UnprocessedItems': {}}
+
+        batch_write_item.side_effect = partially_process
+
+        response = initiate_batch([batch_upload(i) for i in range(3)])
+
+        assert response['statusCode'] == 200
+        assert batch_write_item.call_count == 2
+        tracking_ids = [r['tracking_id'] for r in orjson.loads(response['body'])['uploads']]
+        retried = written_items(batch_write_item)[3:]
+        assert [item['tracking_id'] for item in retried] == tracking_ids[1:]
+
+    def test_write_failure(self, catalog_table):
+        """Test a failed batch write returns 500 and no upload URLs"""
+        catalog_table.meta.client.batch_write_item.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': ''}},
+            'BatchWriteItem'
+        )
+
+        response = initiate_batch([batch_upload(1), batch_upload(2)])
+
+        assert response['statusCode'] == 500
+        assert orjson.loads(response['body']) == {
+            'error': "InternalServerError", 'message': "Failed to initiate uploads"
+        }
+
+
+def complete_batch(uploads):
+    """Call the complete-batch route with the given uploads as the request body"""
+    event = APIGatewayProxyEvent({
+        'httpMethod': "POST",
+        'path': "/v1/catalog/upload/complete-batch",
+        'body': orjson.dumps({'uploads': uploads}).decode()
+    })
+    with patch.object(main.app, 'current_event', event, create=True):
+        return main.complete_upload_batch()
+
+
+def stored_record(Key, ExpressionAttributeValues, **kwargs):
+    """update_item for a table holding every trk_* id except trk_missing"""
+    if Key['tracking_id'] == "trk_missing":
+        raise ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': ''}},
+            'UpdateItem'
+        )
+    return {'Attributes': {
+        'tracking_id': Key['tracking_id'],
+        'tenant_id': "tenant_001",
+        'artisan_id': "artisan_001",
+        'photo_key': ExpressionAttributeValues.get(':photo_key', ''),
+        'audio_key': ExpressionAttributeValues.get(':audio_key', '')
+    }}
+
+
+@pytest.fixture
+def completion_backend():
+    """Mocked catalog table and SQS client behind the complete-batch route"""
+    table = MagicMock()
+    table.update_item.side_effect = stored_record
+    sqs_client = MagicMock()
+    sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+        'Successful': [{'Id': entry['Id'], 'MessageId': f"msg-{entry['Id']}"} for entry in Entries],
+        'Failed': []
+    }
+    with patch.object(upload_handlers, 'catalog_table', table), \
+            patch.object(upload_handlers.sqs_publisher, 'sqs_client', sqs_client), \
+            patch.object(upload_handlers.tenant_service, 'get_tenant_configuration', return_value=None):
+        yield table, sqs_client
+
+
+def completion(tracking_id, **fields):
+    """One UploadCompleteRequest item"""
+    return {'trackingId': tracking_id, 'photoKey': f"tenant_001/artisan_001/{tracking_id}.jpg", **fields}
+
+
+class TestCompleteUploadBatch:
+    """Test POST /v1/catalog/upload/complete-batch"""
+
+    def test_success(self, completion_backend):
+        """Test every upload is recorded and queued with one SendMessageBatch"""
+        table, sqs_client = completion_backend
+        uploads = [completion(f"trk_{i}") for i in range(12)]
+
+        response = complete_batch(uploads)
+
+        assert response['statusCode'] == 200
+        results = orjson.loads(response['body'])['uploads']
+        assert [r['tracking_id'] for r in results] == [f"trk_{i}" for i in range(12)]
+        assert all(r['status'] == "accepted" for r in results)
+        assert table.update_item.call_count == 12
+        assert [len(call.kwargs['Entries']) for call in sqs_client.send_message_batch.call_args_list] == [10, 2]
+        sqs_client.send_message.assert_not_called()
+
+    def test_partial_failure(self, completion_backend):
+        """Test unknown, invalid and rejected uploads fail without failing the rest"""
+        table, sqs_client = completion_backend
+        sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            'Successful': [{'Id': e['Id'], 'MessageId': "msg"} for e in Entries if e['Id'] != '1'],
+            'Failed': [{'Id': '1', 'Code': 'InternalError', 'Message': "Internal error", 'SenderFault': False}]
+        }
+        uploads = [
+            completion("trk_ok"),
+            completion("trk_missing"),
+            completion("trk_rejected"),
+            {'trackingId': "trk_no_media"},
+            completion("trk_bad_lang", language="xx"),
+            completion("trk_audio", photoKey=None, audioKey="tenant_001/artisan_001/trk_audio.opus")
+        ]
+
+        response = complete_batch(uploads)
+
+        assert response['statusCode'] == 200
+        results = orjson.loads(response['body'])['uploads']
+        assert [r['status'] for r in results] == [
+            "accepted", "failed", "failed", "failed", "failed", "accepted"
+        ]
+        assert results[1]['message'] == "Tracking ID trk_missing not found"
+        assert results[2]['message'] == "Internal error"
+        assert "photo_key or audio_key" in results[3]['message']
+        assert "Unsupported language 'xx'" in results[4]['message']
+        (call,) = sqs_client.send_message_batch.call_args_list
+        sent = [orjson.loads(entry['MessageBody'])['trackingId'] for entry in call.kwargs['Entries']]
+        assert sent == ["trk_ok", "trk_rejected", "trk_audio"]
+
+    def test_unreachable_queue_fails_only_unsent_uploads(self, completion_backend):
+        """Test uploads queued before a connection failure are still accepted"""
+        table, sqs_client = completion_backend
+        send = sqs_client.send_message_batch.side_effect
+
+        def second_batch_unreachable(QueueUrl, Entries):
+            if sqs_client.send_message_batch.call_count == 2:
+                raise EndpointConnectionError(endpoint_url="https://sqs.ap-south-1.amazonaws.com")
+            return send(QueueUrl, Entries)
+
+        sqs_client.send_message_batch.side_effect = second_batch_unreachable
+
+        response = complete_batch([completion(f"trk_{i}") for i in range(25)])
+
+        assert response['statusCode'] == 200
+        statuses = [r['status'] for r in orjson.loads(response['body'])['uploads']]
+        assert statuses == ["accepted"] * 10 + ["failed"] * 10 + ["accepted"] * 5
+
+    @pytest.mark.parametrize("count", [0, 26])
+    def test_size_limits(self, completion_backend, count):
+        """Test empty and over-25 batches are rejected before any write"""
+        table, sqs_client = completion_backend
+
+        response = complete_batch([completion(f"trk_{i}") for i in range(count)])
+
+        assert response['statusCode'] == 400
+        assert orjson.loads(response['body'])['error'] == "ValidationError"
+        table.update_item.assert_not_called()
+
+
+def post_raw(route, body):
+    """Call a route function with a raw request body"""
+    event = APIGatewayProxyEvent({'httpMethod': "POST", 'path': "/", 'body': body})
+    with patch.object(main.app, 'current_event', event, create=True):
+        return route()
+
+
+def error_message(response):
+    """400 response message"""
+    assert response['statusCode'] == 400
+    body = orjson.loads(response['body'])
+    assert body['error'] == "ValidationError"
+    return body['message']
+
+
+class TestValidationMessages:
+    """Test 400 bodies describe what was actually wrong with the request"""
+
+    @pytest.mark.parametrize("body,message", [
+        ('{"artisanId": "a1", "contentType": "image/jpeg"}', "tenantId, artisanId, and contentType are required"),
+        ('{"tenantId": "", "artisanId": "a1", "contentType": "image/jpeg"}', "tenantId, artisanId, and contentType are required"),
+        ('{"tenantId": "t1", "artisanId": "a1", "contentType": "video/mp4"}', "contentType must be one of: "),
+        ('{"tenantId": 5, "artisanId": "a1", "contentType": "image/jpeg"}', "tenantId: Input should be a valid string"),
+        ('{"tenantId": "t1", "artisanId"', "Request body must be a JSON object"),
+        ('[]', "Request body must be a JSON object"),
+    ], ids=["missing", "empty", "content_type", "non_string", "malformed", "not_object"])
+    def test_initiate_upload(self, body, message):
+        """Test initiate_upload picks its message from the validation errors"""
+        assert error_message(post_raw(main.initiate_upload, body)).startswith(message)
+
+    @pytest.mark.parametrize("body,message", [
+        ('{"photoKey": "k.jpg"}', "trackingId is required"),
+        ('{"trackingId": ""}', "trackingId is required"),
+        ('{"trackingId": "trk_1", "language": 5}', "language: Input should be a valid string"),
+        ('{"trackingId": "trk_1", "photoKey": 123}', "photoKey: Input should be a valid string"),
+        ('{"trackingId": ', "Request body must be a JSON object"),
+        ('null', "Request body must be a JSON object"),
+    ], ids=["missing", "empty", "language", "photo_key", "malformed", "not_object"])
+    def test_complete_upload(self, body, message):
+        """Test complete_upload only blames trackingId when it is the problem"""
+        assert error_message(post_raw(main.complete_upload, body)).startswith(message)
+
+    def test_several_invalid_fields_listed(self):
+        """Test every invalid field is named when the errors are mixed"""
+        message = error_message(post_raw(
+            main.initiate_upload, '{"artisanId": 7, "contentType": "image/jpeg"}'
+        ))
+
+        assert "tenantId: Field required" in message
+        assert "artisanId: Input should be a valid string" in message
+
+
+class TestDynamicErrorBodies:
+    """Test per-request error bodies are serialized like the fixed ones"""
+
+    def test_not_found_body(self, clock, get_status):
+        """Test a 404 carries the handler's message, unescaped"""
+        get_status.side_effect = ValueError("Tracking ID trk_कला not found")
+
+        response = main.get_catalog_status_v1("trk_कला")
+
+        assert response['statusCode'] == 404
+        assert response['body'] == main._error_body("NotFound", "Tracking ID trk_कला not found")
+        assert "कला" in response['body']
+
+    def test_complete_upload_value_error(self):
+        """Test handler ValueErrors become a ValidationError body"""
+        with patch.object(main.upload_handler, 'complete_upload',
+                          side_effect=ValueError("Tracking ID trk_1 not found")):
+            response = post_raw(main.complete_upload, '{"trackingId": "trk_1", "photoKey": "k.jpg"}')
+
+        assert response['statusCode'] == 400
+        assert orjson.loads(response['body']) == {
+            'error': "ValidationError", 'message': "Tracking ID trk_1 not found"
+        }
+
+
+def test_mock_catalog_status_body():
+    """Test the legacy status body has aware ISO 8601 timestamps"""
+    response = main.get_catalog_status("cat_123")
+
+    body = orjson.loads(response['body'])
+    assert body['catalog_id'] == "cat_123"
+    assert body['status'] == "processing"
+    assert datetime.fromisoformat(body['created_at']).tzinfo is not None
+    assert body['created_at'] == body['updated_at']
@@ -0,0 +1,168 @@
+"""
+Unit tests for the local development API server
+"""
+import io
+import pytest
+from fastapi import UploadFile
+from fastapi.testclient import TestClient
+from backend.lambda_functions.api_handlers import local_server
+
+
+@pytest.fixture
+def client():
+    """Test client over an empty in-memory store"""
+    local_server.catalog_store.clear()
+    local_server.by_tenant.clear()
+    local_server.by_status.clear()
+    return TestClient(local_server.app)
+
+
+def submit(client, tenant_id="artisan_001"):
+    """Submit a catalog and return its ID"""
+    response = client.post("/catalog", json={
+        "tenant_id": tenant_id,
+        "language": "hi",
+        "image_data": "base64_image_data"
+    })
+    assert response.status_code == 202
+    return response.json()["catalog_id"]
+
+
+def submit_multipart(client, tenant_id="artisan_001", image=b"raw_image_data"):
+    """POST /catalog/multipart with one image file"""
+    return client.post(
+        "/catalog/multipart",
+        data={"tenant_id": tenant_id, "language": "hi"},
+        files={"image": ("product.jpg", image, "image/jpeg")}
+    )
+
+
+def test_health_check(client):
+    """Test /health reports a timezone-aware UTC timestamp"""
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["timestamp"].endswith("+00:00")
+
+
+class TestListCatalogs:
+    """Test GET /catalog"""
+
+    def test_limit_and_filters(self, client):
+        """Test the listing honours limit and the tenant filter"""
+        ids = [submit(client) for _ in range(3)]
+        submit(client, tenant_id="artisan_002")
+
+        response = client.get("/catalog", params={"tenant_id": "artisan_001", "limit": 2})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [c["catalog_id"] for c in body["catalogs"]] == ids[:2]
+        assert body["total"] == 2
+        assert body["limit"] == 2
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_non_positive_limit_rejected(self, client, limit):
+        """Test a limit below 1 is a validation error, not a server error"""
+        submit(client)
+
+        response = client.get("/catalog", params={"limit": limit})
+
+        assert response.status_code == 422
+
+
+class TestCORS:
+    """Test the CORS middleware keeps the credentialed wildcard policy"""
+
+    def test_preflight(self, client):
+        """Test preflight requests echo the origin and allow credentials"""
+        response = client.options("/catalog", headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type, x-tenant-id"
+        })
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "content-type, x-tenant-id"
+        assert "Origin" in response.headers["vary"]
+
+    def test_preflight_unknown_method(self, client):
+        """Test a preflight for a non-standard method is refused"""
+        response = client.options("/catalog", headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "PURGE"
+        })
+
+        assert response.status_code == 400
+
+    def test_simple_request(self, client):
+        """Test simple responses carry the echoed origin and credentials flag"""
+        response = client.get("/health", headers={"Origin": "http://localhost:3000"})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert "Origin" in response.headers["vary"]
+
+    def test_request_without_origin(self, client):
+        """Test same-origin requests get no CORS grant"""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+
+def test_catalog_status_matches_listing(client):
+    """Test a single status and its listing entry serialize identically"""
+    catalog_id = submit(client)
+
+    status_body = client.get(f"/catalog/{catalog_id}").json()
+    listed = client.get("/catalog").json()["catalogs"]
+
+    assert status_body["catalog_id"] == catalog_id
+    assert status_body["status"] == "pending"
+    assert listed == [status_body]
+
+
+class TestMultipartSubmission:
+    """Test POST /catalog/multipart"""
+
+    def test_accepted(self, client):
+        """Test a raw image submission is stored like a JSON one"""
+        response = submit_multipart(client)
+
+        assert response.status_code == 202
+        catalog_id = response.json()["catalog_id"]
+        listed = client.get("/catalog", params={"tenant_id": "artisan_001"}).json()["catalogs"]
+        assert [catalog["catalog_id"] for catalog in listed] == [catalog_id]
+
+    @pytest.mark.parametrize("tenant_id", ["", "bad tenant", "a" * 129])
+    def test_tenant_id_rules_match_json_route(self, client, tenant_id):
+        """Test both submission routes reject the same tenant ids"""
+        json_response = client.post("/catalog", json={
+            "tenant_id": tenant_id,
+            "language": "hi",
+            "image_data": "base64_image_data"
+        })
+
+        assert submit_multipart(client, tenant_id).status_code == 422
+        assert json_response.status_code == 422
+
+    def test_oversized_media_rejected(self, client):
+        """Test files over MAX_MEDIA_BYTES are rejected"""
+        response = submit_multipart(client, image=b"x" * (local_server.MAX_MEDIA_BYTES + 1))
+
+        assert response.status_code == 413
+
+    def test_upload_size_measured_without_parser_size(self):
+        """Test an upload the parser did not size is measured, keeping its position"""
+        upload = UploadFile(file=io.BytesIO(b"x" * 1024), size=None)
+        upload.file.seek(10)
+
+        assert local_server._upload_size(upload) == 1024
+        assert upload.file.tell() == 10
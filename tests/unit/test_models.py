@@ -13,7 +13,13 @@ from backend.models.catalog import (
     ONDCCatalogEntry,
     CatalogRecord
 )
-from backend.models.request import CatalogSubmissionRequest, CatalogQueryRequest
+from backend.models.request import (
+    CatalogSubmissionRequest,
+    CatalogQueryRequest,
+    UploadInitiateRequest,
+    UploadInitiateBatchRequest,
+    UploadCompleteRequest
+)
 from backend.models.response import (
     CatalogSubmissionResponse,
     ErrorResponse,
@@ -24,21 +30,60 @@ from backend.models.response import (
 class TestCatalogModels:
     """Test catalog data models"""
     
-    def test_media_file_creation(self):
-        """Test MediaFile model creation"""
-        media = MediaFile(
-            file_id="test123",
-            file_type=MediaType.IMAGE,
-            s3_key="images/test.jpg",
-            s3_bucket="test-bucket",
-            file_size=1024,
-            mime_type="image/jpeg"
-        )
+    @pytest.mark.parametrize("model_cls,kwargs,expected,timestamp_field", [
+        (
+            MediaFile,
+            {
+                "file_id": "test123",
+                "file_type": MediaType.IMAGE,
+                "s3_key": "images/test.jpg",
+                "s3_bucket": "test-bucket",
+                "file_size": 1024,
+                "mime_type": "image/jpeg"
+            },
+            {"file_id": "test123", "file_type": MediaType.IMAGE, "file_size": 1024},
+            "uploaded_at"
+        ),
+        (
+            ONDCCatalogEntry,
+            {
+                "product_name": "Handcrafted Clay Pot",
+                "product_name_vernacular": "मिट्टी का बर्तन",
+                "category": "Home & Kitchen",
+                "description": "Traditional handcrafted clay pot",
+                "description_vernacular": "पारंपरिक हस्तनिर्मित मिट्टी का बर्तन",
+                "attributes": {"material": "clay", "color": "brown", "size": "medium"},
+                "price": 250.0,
+                "cultural_context": "Traditional pottery from Rajasthan"
+            },
+            {
+                "product_name": "Handcrafted Clay Pot",
+                "currency": "INR",
+                "price": 250.0,
+                "attributes": {"material": "clay", "color": "brown", "size": "medium"}
+            },
+            None
+        ),
+        (
+            CatalogRecord,
+            {
+                "catalog_id": "cat_test123",
+                "tenant_id": "artisan_001",
+                "language": LanguageCode.HINDI,
+                "status": ProcessingStatus.PENDING
+            },
+            {"catalog_id": "cat_test123", "status": ProcessingStatus.PENDING, "retry_count": 0},
+            "created_at"
+        ),
+    ], ids=["media_file", "ondc_catalog_entry", "catalog_record"])
+    def test_model_creation(self, model_cls, kwargs, expected, timestamp_field):
+        """Test catalog model creation, defaults and auto timestamps"""
+        model = model_cls(**kwargs)
         
-        assert media.file_id == "test123"
-        assert media.file_type == MediaType.IMAGE
-        assert media.file_size == 1024
-        assert isinstance(media.uploaded_at, datetime)
+        for field, value in expected.items():
+            assert getattr(model, field) == value
+        if timestamp_field:
+            assert isinstance(getattr(model, timestamp_field), datetime)
     
     def test_vision_analysis(self):
         """Test VisionAnalysis model"""
@@ -65,43 +110,6 @@ class TestCatalogModels:
         assert transcription.confidence == 0.92
         assert len(transcription.text) > 0
 
-    
-    def test_ondc_catalog_entry(self):
-        """Test ONDCCatalogEntry model"""
-        entry = ONDCCatalogEntry(
-            product_name="Handcrafted Clay Pot",
-            product_name_vernacular="मिट्टी का बर्तन",
-            category="Home & Kitchen",
-            description="Traditional handcrafted clay pot",
-            description_vernacular="पारंपरिक हस्तनिर्मित मिट्टी का बर्तन",
-            attributes={
-                "material": "clay",
-                "color": "brown",
-                "size": "medium"
-            },
-            price=250.0,
-            cultural_context="Traditional pottery from Rajasthan"
-        )
-        
-        assert entry.product_name == "Handcrafted Clay Pot"
-        assert entry.currency == "INR"
-        assert entry.price == 250.0
-        assert "material" in entry.attributes
-    
-    def test_catalog_record(self):
-        """Test CatalogRecord model"""
-        record = CatalogRecord(
-            catalog_id="cat_test123",
-            tenant_id="artisan_001",
-            language=LanguageCode.HINDI,
-            status=ProcessingStatus.PENDING
-        )
-        
-        assert record.catalog_id == "cat_test123"
-        assert record.status == ProcessingStatus.PENDING
-        assert record.retry_count == 0
-        assert isinstance(record.created_at, datetime)
-
 
 class TestRequestModels:
     """Test API request models"""
@@ -120,6 +128,76 @@ class TestRequestModels:
         assert request.language == LanguageCode.HINDI
         assert request.metadata["location"] == "Jaipur"
     
+    def test_catalog_submission_request_constraints(self):
+        """Test CatalogSubmissionRequest media size and tenant_id format limits"""
+        with pytest.raises(ValueError):
+            CatalogSubmissionRequest(
+                tenant_id="artisan_001",
+                language=LanguageCode.HINDI,
+                image_data="a" * (10 * 1024 * 1024 + 1)
+            )
+        
+        with pytest.raises(ValueError):
+            CatalogSubmissionRequest(
+                tenant_id="artisan 001/../x",
+                language=LanguageCode.HINDI,
+                audio_data="base64_audio_data"
+            )
+    
+    def test_upload_initiate_request_from_json(self):
+        """Test UploadInitiateRequest parses camelCase JSON"""
+        request = UploadInitiateRequest.model_validate_json(
+            '{"tenantId": "tenant_001", "artisanId": "artisan_001", "contentType": "image/jpeg"}'
+        )
+        
+        assert request.tenant_id == "tenant_001"
+        assert request.artisan_id == "artisan_001"
+        assert request.content_type == "image/jpeg"
+    
+    def test_upload_initiate_request_missing_fields(self):
+        """Test UploadInitiateRequest rejects missing or empty fields"""
+        with pytest.raises(ValueError):
+            UploadInitiateRequest.model_validate_json('{"tenantId": "tenant_001"}')
+        
+        with pytest.raises(ValueError):
+            UploadInitiateRequest.model_validate_json(
+                '{"tenantId": "", "artisanId": "artisan_001", "contentType": "image/jpeg"}'
+            )
+    
+    def test_upload_initiate_request_content_type(self):
+        """Test UploadInitiateRequest rejects unsupported content types"""
+        with pytest.raises(ValueError):
+            UploadInitiateRequest.model_validate_json(
+                '{"tenantId": "tenant_001", "artisanId": "artisan_001", "contentType": "video/mp4"}'
+            )
+    
+    def test_upload_initiate_batch_request_limits(self):
+        """Test UploadInitiateBatchRequest accepts 1-25 uploads"""
+        item = '{"tenantId": "tenant_001", "artisanId": "artisan_001", "contentType": "audio/opus"}'
+        
+        request = UploadInitiateBatchRequest.model_validate_json(f'{{"uploads": [{item}, {item}]}}')
+        assert len(request.uploads) == 2
+        assert request.uploads[1].content_type == "audio/opus"
+        
+        with pytest.raises(ValueError):
+            UploadInitiateBatchRequest.model_validate_json('{"uploads": []}')
+        
+        with pytest.raises(ValueError):
+            UploadInitiateBatchRequest.model_validate_json(
+                '{"uploads": [' + ', '.join([item] * 26) + ']}'
+            )
+    
+    def test_upload_complete_request_defaults(self):
+        """Test UploadCompleteRequest optional keys and default language"""
+        request = UploadCompleteRequest.model_validate_json(
+            '{"trackingId": "trk_abc123", "photoKey": "t/a/trk_abc123.jpg"}'
+        )
+        
+        assert request.tracking_id == "trk_abc123"
+        assert request.photo_key == "t/a/trk_abc123.jpg"
+        assert request.audio_key is None
+        assert request.language == "hi"
+    
     def test_catalog_query_request(self):
         """Test CatalogQueryRequest with defaults"""
         request = CatalogQueryRequest()
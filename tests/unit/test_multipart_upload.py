@@ -0,0 +1,210 @@
+"""
+Unit tests for the S3 multipart upload manager
+"""
+import pytest
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from unittest.mock import MagicMock, patch
+from backend.services.s3_upload.multipart_upload import (
+    MultipartUploadManager,
+    PART_UPDATE_BATCH_SIZE
+)
+from backend.services.s3_upload.presigner import S3Presigner
+
+
+BUCKET = "raw-media-bucket"
+
+CONDITION_FAILED = ClientError(
+    {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': ''}},
+    'UpdateItem'
+)
+
+# completed_parts as written before the part number -> ETag map layout
+LEGACY_COMPLETED_PARTS = [
+    {'part_number': 1, 'etag': 'etag-1', 'uploaded_at': '2024-01-01T00:00:00'},
+    {'part_number': 3, 'etag': 'etag-3', 'uploaded_at': '2024-01-01T00:00:05'}
+]
+
+
+def upload_state(completed_parts, num_parts=3):
+    """Stored upload state item"""
+    return {
+        'tracking_id': "trk_abc123",
+        'upload_id': 'upload-123',
+        's3_key': "tenant_001/artisan_001/trk_abc123.jpg",
+        's3_bucket': BUCKET,
+        'status': 'initiated',
+        'num_parts': num_parts,
+        'file_size': num_parts * 5 * 1024 * 1024,
+        'part_size': 5 * 1024 * 1024,
+        'completed_parts': completed_parts
+    }
+
+
+@pytest.fixture
+def s3_client():
+    """us-east-1 client, where botocore presigns S3 with SigV2 by default"""
+    return boto3.client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='AKIDEXAMPLE',
+        aws_secret_access_key='secret',
+        config=Config(s3={'addressing_style': 'virtual'})
+    )
+
+
+@pytest.fixture
+def manager(s3_client):
+    """Manager wired to the test S3 client and a mocked state table"""
+    manager = MultipartUploadManager()
+    manager.s3_client = s3_client
+    manager.raw_bucket = BUCKET
+    manager.presigner = S3Presigner(s3_client, BUCKET)
+    manager.upload_state_table = MagicMock()
+    return manager
+
+
+class TestInitiateMultipartUpload:
+    """Test multipart upload initiation"""
+
+    def test_part_urls_match_boto3(self, manager, s3_client, frozen_clock):
+        """Test each part URL is the URL boto3 would presign for that part"""
+        with patch.object(s3_client, 'create_multipart_upload', return_value={'UploadId': 'upload-123'}):
+            result = manager.initiate_multipart_upload(
+                tracking_id="trk_abc123",
+                tenant_id="tenant_001",
+                artisan_id="artisan_001",
+                content_type="image/jpeg",
+                file_size=12 * 1024 * 1024
+            )
+
+        assert result['num_parts'] == 3
+        assert [part['part_number'] for part in result['part_urls']] == [1, 2, 3]
+        for part in result['part_urls']:
+            assert part['url'] == s3_client.generate_presigned_url(
+                'upload_part',
+                Params={
+                    'Bucket': BUCKET,
+                    'Key': "tenant_001/artisan_001/trk_abc123.jpg",
+                    'UploadId': 'upload-123',
+                    'PartNumber': part['part_number']
+                },
+                ExpiresIn=3600
+            )
+
+        state = manager.upload_state_table.put_item.call_args.kwargs['Item']
+        assert state['upload_id'] == 'upload-123'
+        assert state['num_parts'] == 3
+
+
+def set_part_names(update_call):
+    """Part numbers assigned by one completed_parts update_item call"""
+    return sorted(update_call.kwargs['ExpressionAttributeNames'].values(), key=int)
+
+
+class TestRecordPartsCompletion:
+    """Test batched part completion writes"""
+
+    def test_batches_every_part_update_batch_size(self, manager):
+        """Test parts are written PART_UPDATE_BATCH_SIZE per update_item"""
+        batch = PART_UPDATE_BATCH_SIZE
+        num_parts = 2 * batch + batch // 2
+        parts = [(part_number, f"etag-{part_number}") for part_number in range(1, num_parts + 1)]
+        manager.upload_state_table.update_item.return_value = {
+            'Attributes': {
+                'completed_parts': {str(pn): etag for pn, etag in parts},
+                'num_parts': num_parts
+            }
+        }
+
+        result = manager.record_parts_completion("trk_abc123", parts)
+
+        calls = manager.upload_state_table.update_item.call_args_list
+        assert [len(set_part_names(call)) for call in calls] == [batch, batch, batch // 2]
+        assert set_part_names(calls[2]) == [str(pn) for pn in range(2 * batch + 1, num_parts + 1)]
+        assert result == {
+            'tracking_id': "trk_abc123",
+            'completed_parts': num_parts,
+            'total_parts': num_parts,
+            'is_complete': True
+        }
+
+    def test_duplicate_part_keeps_last_etag(self, manager):
+        """Test a retried part is set once, with its latest ETag"""
+        manager.upload_state_table.update_item.return_value = {
+            'Attributes': {'completed_parts': {'1': 'etag-1b', '2': 'etag-2'}, 'num_parts': 3}
+        }
+
+        manager.record_parts_completion(
+            "trk_abc123", [(1, 'etag-1a'), (2, 'etag-2'), (1, 'etag-1b')]
+        )
+
+        call = manager.upload_state_table.update_item.call_args
+        names = call.kwargs['ExpressionAttributeNames']
+        values = call.kwargs['ExpressionAttributeValues']
+        assert sorted(names.values()) == ['1', '2']
+        assigned = {
+            names[f'#p{index}']: values[f':e{index}'] for index in range(len(names))
+        }
+        assert assigned == {'1': 'etag-1b', '2': 'etag-2'}
+
+    def test_missing_upload_state(self, manager):
+        """Test a failed existence condition surfaces as ValueError"""
+        manager.upload_state_table.update_item.side_effect = CONDITION_FAILED
+        manager.upload_state_table.get_item.return_value = {}
+
+        with pytest.raises(ValueError, match="Upload state not found"):
+            manager.record_part_completion("trk_missing", 1, 'etag-1')
+
+    def test_legacy_list_converted_on_first_write(self, manager):
+        """Test a list-form completed_parts is rewritten as a map with the new part"""
+        table = manager.upload_state_table
+        table.update_item.side_effect = [
+            CONDITION_FAILED,
+            {'Attributes': upload_state({'1': 'etag-1', '2': 'etag-2', '3': 'etag-3'})}
+        ]
+        table.get_item.return_value = {'Item': upload_state(LEGACY_COMPLETED_PARTS)}
+
+        result = manager.record_part_completion("trk_abc123", 2, 'etag-2')
+
+        migration = table.update_item.call_args_list[1].kwargs
+        assert migration['ConditionExpression'] == 'completed_parts = :legacy'
+        assert migration['ExpressionAttributeValues'][':legacy'] == LEGACY_COMPLETED_PARTS
+        assert migration['ExpressionAttributeValues'][':parts'] == {
+            '1': 'etag-1', '2': 'etag-2', '3': 'etag-3'
+        }
+        assert result['is_complete'] is True
+
+
+@pytest.mark.parametrize("completed_parts", [
+    {'3': 'etag-3', '1': 'etag-1'},
+    LEGACY_COMPLETED_PARTS
+], ids=["map", "legacy_list"])
+def test_get_upload_state_completed_parts(manager, completed_parts):
+    """Test resume state lists completed and pending part numbers"""
+    manager.upload_state_table.get_item.return_value = {'Item': upload_state(completed_parts)}
+
+    state = manager.get_upload_state("trk_abc123")
+
+    assert state['completed_parts'] == [1, 3]
+    assert state['pending_parts'] == [2]
+
+
+@pytest.mark.parametrize("completed_parts", [
+    {'10': 'etag-10', '2': 'etag-2', **{str(pn): f"etag-{pn}" for pn in (1, 3, 4, 5, 6, 7, 8, 9)}},
+    [{'part_number': pn, 'etag': f"etag-{pn}"} for pn in (10, 2, 1, 3, 4, 5, 6, 7, 8, 9)]
+], ids=["map", "legacy_list"])
+def test_complete_multipart_upload_orders_parts(manager, s3_client, completed_parts):
+    """Test parts are sent to S3 in numeric part order"""
+    manager.upload_state_table.get_item.return_value = {
+        'Item': upload_state(completed_parts, num_parts=10)
+    }
+
+    with patch.object(s3_client, 'complete_multipart_upload', return_value={'ETag': '"final"'}) as complete:
+        result = manager.complete_multipart_upload("trk_abc123")
+
+    sent = complete.call_args.kwargs['MultipartUpload']['Parts']
+    assert [part['PartNumber'] for part in sent] == list(range(1, 11))
+    assert all(part['ETag'] == f"etag-{part['PartNumber']}" for part in sent)
+    assert result['status'] == 'completed'
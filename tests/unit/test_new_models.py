@@ -3,6 +3,8 @@ Unit tests for new data models (Task 2.2)
 """
 import pytest
 from datetime import datetime, timezone
+from types import MappingProxyType
+from pydantic import ValidationError
 from backend.models import (
     # Core models
     LocalQueueEntry,
@@ -27,82 +29,123 @@ from backend.models import (
     LanguageCode,
 )
 
+FROZEN_NOW = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+LONG_NAME = "A" * 101  # Exceeds 100 chars
+LONG_SHORT_DESC = "A" * 501  # Exceeds 500 chars
+
+
+@pytest.fixture(scope="session")
+def base_queue_entry_kwargs():
+    """Common LocalQueueEntry constructor arguments"""
+    return MappingProxyType({
+        "local_id": "local_123",
+        "photo_path": "/storage/photo.jpg",
+        "audio_path": "/storage/audio.opus",
+        "photo_size": 1024000,
+        "audio_size": 512000,
+    })
+
+
+@pytest.fixture(scope="session")
+def base_record_kwargs():
+    """Common CatalogProcessingRecord constructor arguments"""
+    return MappingProxyType({
+        "tracking_id": "trk_abc123",
+        "tenant_id": "tenant_001",
+        "artisan_id": "artisan_001",
+        "photo_key": "photos/abc123.jpg",
+        "audio_key": "audio/abc123.opus",
+        "language": LanguageCode.HINDI,
+    })
+
+
+@pytest.fixture(scope="session")
+def base_profile_kwargs():
+    """Common ArtisanProfile constructor arguments"""
+    return MappingProxyType({
+        "artisan_id": "artisan_001",
+        "tenant_id": "tenant_001",
+        "name": "Ramesh Kumar",
+        "phone_number": "+919876543210",
+        "preferred_language": LanguageCode.HINDI,
+    })
+
 
 class TestLocalQueueEntry:
     """Test LocalQueueEntry model for edge client"""
     
-    def test_local_queue_entry_creation(self):
-        """Test creating a local queue entry"""
-        entry = LocalQueueEntry(
-            local_id="local_123",
-            photo_path="/storage/photo.jpg",
-            audio_path="/storage/audio.opus",
-            photo_size=1024000,
-            audio_size=512000
-        )
+    @pytest.mark.parametrize("override,expected", [
+        (
+            {},
+            {"sync_status": QueueStatus.QUEUED, "retry_count": 0, "tracking_id": None}
+        ),
+        (
+            {"tracking_id": "trk_abc123", "sync_status": QueueStatus.SYNCING},
+            {"sync_status": QueueStatus.SYNCING, "tracking_id": "trk_abc123"}
+        ),
+    ], ids=["defaults", "after_upload_initiation"])
+    def test_local_queue_entry_creation(self, base_queue_entry_kwargs, override, expected):
+        """Test creating a local queue entry, before and after upload initiation"""
+        entry = LocalQueueEntry(**{**base_queue_entry_kwargs, **override})
         
         assert entry.local_id == "local_123"
-        assert entry.sync_status == QueueStatus.QUEUED
-        assert entry.retry_count == 0
-        assert entry.tracking_id is None
         assert isinstance(entry.captured_at, datetime)
-    
-    def test_local_queue_entry_with_tracking_id(self):
-        """Test queue entry after upload initiation"""
-        entry = LocalQueueEntry(
-            local_id="local_123",
-            photo_path="/storage/photo.jpg",
-            audio_path="/storage/audio.opus",
-            photo_size=1024000,
-            audio_size=512000,
-            tracking_id="trk_abc123",
-            sync_status=QueueStatus.SYNCING
-        )
-        
-        assert entry.tracking_id == "trk_abc123"
-        assert entry.sync_status == QueueStatus.SYNCING
+        for field, value in expected.items():
+            assert getattr(entry, field) == value
 
 
 class TestCatalogProcessingRecord:
     """Test CatalogProcessingRecord model"""
     
-    def test_catalog_processing_record_creation(self):
-        """Test creating a catalog processing record"""
-        record = CatalogProcessingRecord(
-            tracking_id="trk_abc123",
-            tenant_id="tenant_001",
-            artisan_id="artisan_001",
-            photo_key="photos/abc123.jpg",
-            audio_key="audio/abc123.opus",
-            language=LanguageCode.HINDI
-        )
+    @pytest.mark.parametrize("override,expected", [
+        (
+            {},
+            {
+                "asr_status": ProcessingStatus.PENDING,
+                "vision_status": ProcessingStatus.PENDING,
+                "extraction_status": ProcessingStatus.PENDING,
+                "mapping_status": ProcessingStatus.PENDING,
+                "submission_status": ProcessingStatus.PENDING,
+            }
+        ),
+        (
+            {
+                "asr_status": ProcessingStatus.COMPLETED,
+                "asr_result": {"transcription": "यह एक साड़ी है", "confidence": 0.95},
+                "vision_status": ProcessingStatus.COMPLETED,
+                "vision_result": {"category": "saree", "colors": ["red", "gold"]},
+            },
+            {
+                "asr_status": ProcessingStatus.COMPLETED,
+                "asr_result": {"transcription": "यह एक साड़ी है", "confidence": 0.95},
+                "vision_result": {"category": "saree", "colors": ["red", "gold"]},
+            }
+        ),
+    ], ids=["defaults", "with_results"])
+    def test_catalog_processing_record_creation(self, base_record_kwargs, override, expected):
+        """Test creating a catalog processing record, with and without results"""
+        record = CatalogProcessingRecord(**{**base_record_kwargs, **override})
         
         assert record.tracking_id == "trk_abc123"
-        assert record.asr_status == ProcessingStatus.PENDING
-        assert record.vision_status == ProcessingStatus.PENDING
-        assert record.extraction_status == ProcessingStatus.PENDING
-        assert record.mapping_status == ProcessingStatus.PENDING
-        assert record.submission_status == ProcessingStatus.PENDING
         assert isinstance(record.created_at, datetime)
+        for field, value in expected.items():
+            assert getattr(record, field) == value
     
-    def test_catalog_processing_record_with_results(self):
-        """Test record with processing results"""
-        record = CatalogProcessingRecord(
-            tracking_id="trk_abc123",
-            tenant_id="tenant_001",
-            artisan_id="artisan_001",
-            photo_key="photos/abc123.jpg",
-            audio_key="audio/abc123.opus",
-            language=LanguageCode.HINDI,
-            asr_status=ProcessingStatus.COMPLETED,
-            asr_result={"transcription": "यह एक साड़ी है", "confidence": 0.95},
-            vision_status=ProcessingStatus.COMPLETED,
-            vision_result={"category": "saree", "colors": ["red", "gold"]}
-        )
+    def test_catalog_processing_record_to_ddb_item(self, base_record_kwargs):
+        """Test DynamoDB item serialization"""
+        record = CatalogProcessingRecord(**{
+            **base_record_kwargs,
+            "audio_key": "",
+            "created_at": datetime(2024, 1, 1, 12, 0, 0)
+        })
         
-        assert record.asr_status == ProcessingStatus.COMPLETED
-        assert record.asr_result["confidence"] == 0.95
-        assert "red" in record.vision_result["colors"]
+        item = record.to_ddb_item()
+        
+        assert item["created_at"] == "2024-01-01T12:00:00"
+        assert item["language"] == "hi"
+        assert item["asr_status"] == "pending"
+        assert "asr_result" not in item
+        assert "completed_at" not in item
 
 
 class TestExtractedAttributes:
@@ -179,19 +222,19 @@ class TestONDCCatalogItem:
     def test_item_descriptor_validation(self):
         """Test descriptor field validation"""
         # Test name length validation
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="at most 100"):
             ItemDescriptor(
-                name="A" * 101,  # Exceeds 100 chars
+                name=LONG_NAME,
                 short_desc="Short description",
                 long_desc="Long description",
                 images=[]
             )
         
         # Test short_desc length validation
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="at most 500"):
             ItemDescriptor(
                 name="Valid name",
-                short_desc="A" * 501,  # Exceeds 500 chars
+                short_desc=LONG_SHORT_DESC,
                 long_desc="Long description",
                 images=[]
             )
@@ -223,40 +266,29 @@ class TestTenantConfiguration:
 class TestArtisanProfile:
     """Test ArtisanProfile model"""
     
-    def test_artisan_profile_creation(self):
-        """Test creating artisan profile"""
-        profile = ArtisanProfile(
-            artisan_id="artisan_001",
-            tenant_id="tenant_001",
-            name="Ramesh Kumar",
-            phone_number="+919876543210",
-            preferred_language=LanguageCode.HINDI,
-            region="Uttar Pradesh",
-            district="Varanasi",
-            craft_type="Handloom",
-            specialization="Banarasi Silk Weaving"
-        )
+    @pytest.mark.parametrize("override,expected", [
+        (
+            {
+                "region": "Uttar Pradesh",
+                "district": "Varanasi",
+                "craft_type": "Handloom",
+                "specialization": "Banarasi Silk Weaving",
+            },
+            {"craft_type": "Handloom", "total_catalogs_created": 0, "is_active": True}
+        ),
+        (
+            {"total_catalogs_created": 50, "total_catalogs_published": 45},
+            {"total_catalogs_created": 50, "total_catalogs_published": 45}
+        ),
+    ], ids=["defaults", "with_statistics"])
+    def test_artisan_profile_creation(self, base_profile_kwargs, override, expected):
+        """Test creating artisan profile, with and without statistics"""
+        profile = ArtisanProfile(**{**base_profile_kwargs, **override})
         
         assert profile.artisan_id == "artisan_001"
         assert profile.preferred_language == LanguageCode.HINDI
-        assert profile.craft_type == "Handloom"
-        assert profile.total_catalogs_created == 0  # Default value
-        assert profile.is_active is True
-    
-    def test_artisan_profile_with_statistics(self):
-        """Test profile with statistics"""
-        profile = ArtisanProfile(
-            artisan_id="artisan_001",
-            tenant_id="tenant_001",
-            name="Ramesh Kumar",
-            phone_number="+919876543210",
-            preferred_language=LanguageCode.HINDI,
-            total_catalogs_created=50,
-            total_catalogs_published=45
-        )
-        
-        assert profile.total_catalogs_created == 50
-        assert profile.total_catalogs_published == 45
+        for field, value in expected.items():
+            assert getattr(profile, field) == value
 
 
 class TestTenantQuotaUsage:
@@ -289,11 +321,12 @@ class TestResponseModels:
         response = UploadResponse(
             tracking_id="trk_abc123",
             upload_url="https://s3.amazonaws.com/bucket/path",
-            expires_at=datetime.now(timezone.utc)
+            expires_at=FROZEN_NOW
         )
         
         assert response.tracking_id == "trk_abc123"
         assert "s3.amazonaws.com" in response.upload_url
+        assert response.expires_at == FROZEN_NOW
     
     def test_upload_complete_response(self):
         """Test UploadCompleteResponse model"""
@@ -327,3 +360,17 @@ class TestResponseModels:
         
         assert detail.field == "language"
         assert detail.code == "INVALID_LANGUAGE"
+    
+    def test_response_models_are_frozen(self):
+        """Test per-request response models reject mutation and unknown fields"""
+        update = StatusUpdate(
+            tracking_id="trk_abc123",
+            stage="uploaded",
+            message="Queued"
+        )
+        
+        with pytest.raises(ValueError):
+            update.stage = "completed"
+        
+        with pytest.raises(ValueError):
+            UploadCompleteResponse(tracking_id="trk_abc123", unexpected="value")
@@ -0,0 +1,72 @@
+"""
+Unit tests for the direct S3 presigner
+"""
+import pytest
+import boto3
+from botocore.config import Config
+from unittest.mock import patch
+from backend.services.s3_upload.presigner import S3Presigner
+
+
+BUCKET = "raw-media-bucket"
+KEY = "tenant_001/artisan_001/trk abc123.jpg"
+
+
+def make_client(region):
+    """S3 client with the same virtual-hosted endpoint the fast path builds"""
+    return boto3.client(
+        's3',
+        region_name=region,
+        aws_access_key_id='AKIDEXAMPLE',
+        aws_secret_access_key='secret',
+        config=Config(s3={'addressing_style': 'virtual'})
+    )
+
+
+# ap-south-1 presigns with SigV4; us-east-1 defaults presigned URLs to SigV2
+@pytest.mark.parametrize("region,signature_param", [
+    ("ap-south-1", "X-Amz-Signature="),
+    ("us-east-1", "Signature="),
+])
+class TestS3Presigner:
+    """Test the fast path matches boto3's generate_presigned_url"""
+
+    def test_put_object_url_matches_boto3(self, frozen_clock, region, signature_param):
+        """Test single-part PUT URLs are identical to boto3's"""
+        client = make_client(region)
+        presigner = S3Presigner(client, BUCKET)
+        assert presigner._fast_path
+
+        url = presigner.put_object_url(KEY, "image/jpeg", 900)
+
+        assert url == client.generate_presigned_url(
+            'put_object',
+            Params={'Bucket': BUCKET, 'Key': KEY, 'ContentType': "image/jpeg"},
+            ExpiresIn=900
+        )
+        assert signature_param in url
+
+    def test_upload_part_url_matches_boto3(self, frozen_clock, region, signature_param):
+        """Test multipart part URLs are identical to boto3's"""
+        client = make_client(region)
+        presigner = S3Presigner(client, BUCKET)
+
+        url = presigner.upload_part_url(KEY, "upload-123", 7)
+
+        assert url == client.generate_presigned_url(
+            'upload_part',
+            Params={'Bucket': BUCKET, 'Key': KEY, 'UploadId': "upload-123", 'PartNumber': 7},
+            ExpiresIn=3600
+        )
+        assert signature_param in url
+
+
+def test_dotted_bucket_uses_boto3():
+    """Test buckets that cannot be virtual-hosted skip the fast path"""
+    client = make_client("ap-south-1")
+    presigner = S3Presigner(client, "raw.media.bucket")
+
+    assert not presigner._fast_path
+    with patch.object(client, 'generate_presigned_url', return_value="https://fallback") as fallback:
+        assert presigner.put_object_url(KEY, "image/jpeg") == "https://fallback"
+    fallback.assert_called_once()
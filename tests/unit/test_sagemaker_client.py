@@ -0,0 +1,119 @@
+"""
+Unit tests for SageMaker request encoding
+"""
+import io
+import json
+import base64
+import pytest
+from unittest.mock import patch
+from backend.services.sagemaker_client import SagemakerClient
+
+
+IMAGE = b'\xff\xd8\xff\xe0fake-jpeg'
+AUDIO = b'OggSfake-opus'
+
+ENDPOINT_RESULT = {
+    'vision': {'category': 'handicraft', 'confidence': 0.9},
+    'transcription': {'text': 'haath se bana', 'language': 'ta', 'confidence': 0.9}
+}
+
+
+@pytest.fixture
+def invoke_endpoint():
+    """SagemakerClient.client.invoke_endpoint returning ENDPOINT_RESULT"""
+    client = SagemakerClient(endpoint_name="vision-asr", region='ap-south-1')
+    with patch.object(client.client, 'invoke_endpoint') as invoke_endpoint:
+        invoke_endpoint.side_effect = lambda **kwargs: {
+            'Body': io.BytesIO(json.dumps(ENDPOINT_RESULT).encode())
+        }
+        invoke_endpoint.sagemaker_client = client
+        yield invoke_endpoint
+
+
+def sent_request(invoke_endpoint):
+    """(ContentType, Body) of the single invoke_endpoint call"""
+    kwargs = invoke_endpoint.call_args.kwargs
+    return kwargs['ContentType'], kwargs['Body']
+
+
+@pytest.mark.parametrize("image,audio,content_type,body", [
+    (IMAGE, None, 'application/x-image; language=ta', IMAGE),
+    (None, AUDIO, 'application/x-audio; language=ta', AUDIO),
+], ids=["image", "audio"])
+def test_single_modality_sends_raw_bytes_with_hint(invoke_endpoint, image, audio, content_type, body):
+    """Test raw media requests carry the caller's language hint"""
+    invoke_endpoint.sagemaker_client.invoke_combined_endpoint(
+        image_bytes=image, audio_bytes=audio, language_hint='ta'
+    )
+
+    assert sent_request(invoke_endpoint) == (content_type, body)
+
+
+@pytest.mark.parametrize("image,audio,content_type", [
+    (IMAGE, None, 'application/x-image'),
+    (None, AUDIO, 'application/x-audio'),
+], ids=["image", "audio"])
+def test_single_modality_without_hint(invoke_endpoint, image, audio, content_type):
+    """Test no language is sent when the caller gives none"""
+    invoke_endpoint.sagemaker_client.invoke_combined_endpoint(image_bytes=image, audio_bytes=audio)
+
+    assert sent_request(invoke_endpoint)[0] == content_type
+
+
+@pytest.mark.parametrize("language_hint", ['ta', None])
+def test_multimodal_sends_json(invoke_endpoint, language_hint):
+    """Test image + audio requests keep the base64 JSON payload"""
+    result = invoke_endpoint.sagemaker_client.invoke_combined_endpoint(
+        image_bytes=IMAGE, audio_bytes=AUDIO, language_hint=language_hint
+    )
+
+    content_type, body = sent_request(invoke_endpoint)
+    payload = json.loads(body)
+    assert content_type == 'application/json'
+    assert base64.b64decode(payload['image']) == IMAGE
+    assert base64.b64decode(payload['audio']) == AUDIO
+    assert payload.get('language_hint') == language_hint
+    assert result['transcription']['low_confidence'] is False
+
+
+def test_asr_wrapper_passes_language(invoke_endpoint):
+    """Test invoke_asr_model sends its language code"""
+    transcription = invoke_endpoint.sagemaker_client.invoke_asr_model(AUDIO, language_code='te')
+
+    assert sent_request(invoke_endpoint)[0] == 'application/x-audio; language=te'
+    assert transcription['text'] == 'haath se bana'
+
+
+class TestInputFn:
+    """Test the endpoint decodes each request format the client sends"""
+
+    @pytest.fixture
+    def inference(self):
+        pytest.importorskip("numpy")
+        from backend.services.sagemaker_client.model import inference
+        return inference
+
+    @pytest.mark.parametrize("content_type,image,audio", [
+        ('application/x-image; language=ta', True, False),
+        ('application/x-audio; language=ta', False, True),
+    ], ids=["image", "audio"])
+    def test_raw_media_language(self, inference, content_type, image, audio):
+        """Test raw media requests keep the language parameter"""
+        data = inference.input_fn(b'media', content_type)
+
+        assert data['language_hint'] == 'ta'
+        assert (data['image'] is not None, data['audio'] is not None) == (image, audio)
+
+    @pytest.mark.parametrize("content_type,body", [
+        ('application/x-image', b'media'),
+        ('application/x-audio', b'media'),
+        ('application/json', json.dumps({'audio': base64.b64encode(AUDIO).decode()}).encode()),
+    ], ids=["image", "audio", "json"])
+    def test_default_language(self, inference, content_type, body):
+        """Test every format falls back to 'hi' without a hint"""
+        assert inference.input_fn(body, content_type)['language_hint'] == 'hi'
+
+    def test_unsupported_content_type(self, inference):
+        """Test unknown content types are rejected"""
+        with pytest.raises(ValueError, match="Unsupported content type"):
+            inference.input_fn(b'media', 'text/plain')
@@ -0,0 +1,228 @@
+"""
+Unit tests for SQS batch publishing
+"""
+import orjson
+import pytest
+from unittest.mock import MagicMock
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+from backend.services.queue.sqs_publisher import (
+    SQSPublisher,
+    SQS_BATCH_MAX_ENTRIES,
+    SQS_BATCH_MAX_BYTES
+)
+
+
+QUEUE_URL = "https://sqs.ap-south-1.amazonaws.com/123456789012/catalog-processing"
+
+
+def catalog_message(index, **overrides):
+    """publish_catalog_processing_message keyword arguments"""
+    return {
+        'tracking_id': f"trk_{index:04d}",
+        'tenant_id': "tenant_001",
+        'artisan_id': "artisan_001",
+        'photo_key': f"tenant_001/artisan_001/trk_{index:04d}.jpg",
+        'audio_key': '',
+        'language': 'hi',
+        **overrides
+    }
+
+
+def status_update(index, **overrides):
+    """publish_status_update keyword arguments"""
+    return {
+        'tracking_id': f"trk_{index:04d}",
+        'stage': 'completed',
+        'status': 'success',
+        'message': "Catalog entry published",
+        **overrides
+    }
+
+
+def all_successful(QueueUrl, Entries):
+    """send_message_batch response accepting every entry"""
+    return {
+        'Successful': [{'Id': entry['Id'], 'MessageId': f"msg-{entry['Id']}"} for entry in Entries],
+        'Failed': []
+    }
+
+
+@pytest.fixture
+def publisher():
+    """Publisher on a standard queue with a mocked SQS client"""
+    publisher = SQSPublisher()
+    publisher.sqs_client = MagicMock()
+    publisher.sqs_client.send_message_batch.side_effect = all_successful
+    publisher.queue_url = QUEUE_URL
+    return publisher
+
+
+def sent_batches(publisher):
+    """Entries of each send_message_batch call"""
+    return [call.kwargs['Entries'] for call in publisher.sqs_client.send_message_batch.call_args_list]
+
+
+class TestPublishCatalogProcessingBatch:
+    """Test SendMessageBatch chunking and per-message results"""
+
+    def test_chunks_by_entry_limit(self, publisher):
+        """Test messages are sent at most SQS_BATCH_MAX_ENTRIES per request"""
+        count = 2 * SQS_BATCH_MAX_ENTRIES + 3
+        messages = [catalog_message(i) for i in range(count)]
+
+        results = publisher.publish_catalog_processing_batch(messages)
+
+        batches = sent_batches(publisher)
+        assert [len(batch) for batch in batches] == [SQS_BATCH_MAX_ENTRIES, SQS_BATCH_MAX_ENTRIES, 3]
+        assert [entry['Id'] for batch in batches for entry in batch] == [str(i) for i in range(count)]
+        assert [result['tracking_id'] for result in results] == [m['tracking_id'] for m in messages]
+        assert all(result['status'] == 'published' for result in results)
+        assert results[12]['message_id'] == "msg-12"
+        publisher.sqs_client.send_message.assert_not_called()
+
+    def test_splits_by_payload_size(self, publisher):
+        """Test a batch is flushed before it would exceed SQS_BATCH_MAX_BYTES"""
+        padding = 'x' * (SQS_BATCH_MAX_BYTES // 3)
+        messages = [catalog_message(i, metadata={'notes': padding}) for i in range(4)]
+
+        results = publisher.publish_catalog_processing_batch(messages)
+
+        batches = sent_batches(publisher)
+        assert [len(batch) for batch in batches] == [2, 2]
+        for batch in batches:
+            assert sum(publisher._entry_size(entry) for entry in batch) <= SQS_BATCH_MAX_BYTES
+        assert all(result['status'] == 'published' for result in results)
+
+    def test_failed_entries_mapped_by_id(self, publisher):
+        """Test entries SQS rejects are reported failed on the matching message"""
+        publisher.sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            'Successful': [{'Id': e['Id'], 'MessageId': f"msg-{e['Id']}"} for e in Entries if e['Id'] != '1'],
+            'Failed': [{'Id': '1', 'Code': 'InternalError', 'Message': "Internal error", 'SenderFault': False}]
+        }
+
+        results = publisher.publish_catalog_processing_batch([catalog_message(i) for i in range(3)])
+
+        assert [result['status'] for result in results] == ['published', 'failed', 'published']
+        assert results[1]['tracking_id'] == "trk_0001"
+        assert results[1]['error'] == "Internal error"
+        assert results[2]['message_id'] == "msg-2"
+
+    def test_invalid_message_not_sent(self, publisher):
+        """Test a message failing validation fails alone and is not sent"""
+        messages = [catalog_message(0), catalog_message(1, language='xx'), catalog_message(2)]
+
+        results = publisher.publish_catalog_processing_batch(messages)
+
+        assert [result['status'] for result in results] == ['published', 'failed', 'published']
+        assert "Unsupported language 'xx'" in results[1]['error']
+        (batch,) = sent_batches(publisher)
+        assert [entry['Id'] for entry in batch] == ['0', '2']
+        assert results[2]['message_id'] == "msg-2"
+
+    def test_entries_match_single_message(self, publisher):
+        """Test batch entries carry the same body and attributes as send_message"""
+        publisher.sqs_client.send_message.return_value = {'MessageId': "msg-single"}
+        message = catalog_message(0, metadata={'location': "Jaipur"})
+
+        single = publisher.publish_catalog_processing_message(**message)
+        batched = publisher.publish_catalog_processing_batch([message])
+
+        sent = publisher.sqs_client.send_message.call_args.kwargs
+        (entry,), = sent_batches(publisher)
+        body, sent_body = orjson.loads(entry['MessageBody']), orjson.loads(sent['MessageBody'])
+        body.pop('timestamp'), sent_body.pop('timestamp')
+        assert body == sent_body
+        assert entry['MessageAttributes'] == sent['MessageAttributes']
+        assert batched[0]['idempotency_key'] == single['idempotency_key']
+
+    def test_fifo_queue_entries(self, publisher):
+        """Test FIFO queues get deduplication and group ids per entry"""
+        publisher.queue_url = QUEUE_URL + ".fifo"
+
+        results = publisher.publish_catalog_processing_batch([catalog_message(0)])
+
+        (entry,), = sent_batches(publisher)
+        assert entry['MessageDeduplicationId'] == results[0]['idempotency_key']
+        assert entry['MessageGroupId'] == "tenant_001"
+
+
+class TestPublishStatusUpdateBatch:
+    """Test batched status updates"""
+
+    def test_chunks_and_bodies(self, publisher):
+        """Test updates are chunked and carry the same body as publish_status_update"""
+        updates = [status_update(i) for i in range(SQS_BATCH_MAX_ENTRIES + 1)]
+        updates[3] = status_update(3, catalog_id="ondc_cat_3")
+        updates[4] = status_update(4, stage='failed', status='error', error_details={'code': 'E1'})
+
+        results = publisher.publish_status_update_batch(updates)
+
+        batches = sent_batches(publisher)
+        assert [len(batch) for batch in batches] == [SQS_BATCH_MAX_ENTRIES, 1]
+        bodies = [orjson.loads(entry['MessageBody']) for batch in batches for entry in batch]
+        assert bodies[3]['catalogId'] == "ondc_cat_3"
+        assert bodies[4]['errorDetails'] == {'code': 'E1'}
+        assert batches[0][4]['MessageAttributes']['Stage']['StringValue'] == 'failed'
+        assert [result['tracking_id'] for result in results] == [u['tracking_id'] for u in updates]
+        assert all(result['status'] == 'published' for result in results)
+
+    def test_failed_entries_mapped_by_id(self, publisher):
+        """Test entries SQS rejects are reported failed on the matching update"""
+        publisher.sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            'Successful': [{'Id': '0', 'MessageId': "msg-0"}],
+            'Failed': [{'Id': '1', 'Code': 'InvalidParameterValue', 'SenderFault': True}]
+        }
+
+        results = publisher.publish_status_update_batch([status_update(0), status_update(1)])
+
+        assert [result['status'] for result in results] == ['published', 'failed']
+        assert results[1]['error'] == 'InvalidParameterValue'
+
+    def test_client_error_keeps_other_batches(self, publisher):
+        """Test a batch request that raises fails only its own updates"""
+        throttled = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': "Rate exceeded"}},
+            'SendMessageBatch'
+        )
+        publisher.sqs_client.send_message_batch.side_effect = [
+            all_successful(QUEUE_URL, [{'Id': str(i)} for i in range(SQS_BATCH_MAX_ENTRIES)]),
+            throttled,
+            all_successful(QUEUE_URL, [{'Id': str(2 * SQS_BATCH_MAX_ENTRIES)}])
+        ]
+        count = 2 * SQS_BATCH_MAX_ENTRIES + 1
+
+        results = publisher.publish_status_update_batch([status_update(i) for i in range(count)])
+
+        assert publisher.sqs_client.send_message_batch.call_count == 3
+        first, second, last = (
+            results[:SQS_BATCH_MAX_ENTRIES],
+            results[SQS_BATCH_MAX_ENTRIES:count - 1],
+            results[-1]
+        )
+        assert all(result['status'] == 'published' and result['message_id'] for result in first)
+        assert all(result['status'] == 'failed' for result in second)
+        assert all(result['error'] == 'ThrottlingException' for result in second)
+        assert last['status'] == 'published'
+
+    @pytest.mark.parametrize("error,error_code", [
+        (EndpointConnectionError(endpoint_url=QUEUE_URL), 'EndpointConnectionError'),
+        (ReadTimeoutError(endpoint_url=QUEUE_URL), 'ReadTimeoutError')
+    ], ids=["connection", "read_timeout"])
+    def test_connection_error_keeps_other_batches(self, publisher, error, error_code):
+        """Test a batch request that cannot reach SQS fails only its own updates"""
+        publisher.sqs_client.send_message_batch.side_effect = [
+            all_successful(QUEUE_URL, [{'Id': str(i)} for i in range(SQS_BATCH_MAX_ENTRIES)]),
+            error,
+            all_successful(QUEUE_URL, [{'Id': str(2 * SQS_BATCH_MAX_ENTRIES)}])
+        ]
+        count = 2 * SQS_BATCH_MAX_ENTRIES + 1
+
+        results = publisher.publish_status_update_batch([status_update(i) for i in range(count)])
+
+        assert publisher.sqs_client.send_message_batch.call_count == 3
+        assert all(result['status'] == 'published' for result in results[:SQS_BATCH_MAX_ENTRIES])
+        assert all(
+            result['status'] == 'failed' and result['error'] == error_code
+            for result in results[SQS_BATCH_MAX_ENTRIES:count - 1]
+        )
+        assert results[-1]['status'] == 'published'